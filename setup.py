@@ -104,6 +104,8 @@ setup(
             "cython>=3.0",
             "build",
             "wheel",
+            "pytest",
+            "pytest-xdist",
         ],
     },
     # Include compiled .so/.pyd files in the package
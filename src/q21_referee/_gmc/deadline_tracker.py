@@ -18,6 +18,11 @@ from typing import Dict, List
 logger = logging.getLogger("q21_referee.deadline_tracker")
 
 
+def _clock() -> float:
+    """Monotonic time source; tests may swap this module attribute."""
+    return time.monotonic()
+
+
 class DeadlineTracker:
     """
     Tracks player response deadlines keyed by player email.
@@ -33,7 +38,7 @@ class DeadlineTracker:
         self, phase: str, player_email: str, deadline_seconds: float
     ) -> None:
         """Set (or overwrite) a deadline for a player."""
-        expires_at = time.monotonic() + deadline_seconds
+        expires_at = _clock() + deadline_seconds
         self._deadlines[player_email] = {
             "phase": phase,
             "player_email": player_email,
@@ -50,7 +55,7 @@ class DeadlineTracker:
 
         Each returned dict contains 'phase' and 'player_email'.
         """
-        now = time.monotonic()
+        now = _clock()
         expired: List[dict] = []
 
         expired_keys: List[str] = []
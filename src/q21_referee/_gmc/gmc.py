@@ -2,7 +2,7 @@
 # PRD: docs/prd-rlgm.md
 """GMC wrapper — accepts GPRM from RLGM, returns GameResult."""
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, List, Mapping, Optional, Tuple
 
 from .state import GameState, GamePhase, PlayerState
 from .envelope_builder import EnvelopeBuilder
@@ -21,9 +21,10 @@ class GameManagementCycle:
     High-level wrapper for a single game execution.
 
     Accepts GPRM from RLGM, manages game flow, and returns GameResult.
+    The config mapping is only read (never copied or mutated).
     """
 
-    def __init__(self, gprm: GPRM, ai: RefereeAI, config: Dict[str, Any],
+    def __init__(self, gprm: GPRM, ai: RefereeAI, config: Mapping[str, Any],
                  single_player_mode: bool = False,
                  missing_player_role: Optional[str] = None):
         self.gprm = gprm
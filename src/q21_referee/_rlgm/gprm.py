@@ -12,14 +12,15 @@ GMC to execute a single match.
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GPRM:
     """
     Game Parameters passed from RLGM to GMC.
 
     This is a frozen (immutable) dataclass containing all the information
     GMC needs to execute a single game between two players. Once created,
-    the game_id and other fields cannot be modified.
+    the game_id and other fields cannot be modified. Slotted, so
+    instances carry no per-instance __dict__.
 
     Attributes:
         player1_email: Email address of player 1
@@ -63,10 +63,10 @@ class BroadcastAssignmentTableHandler(BaseBroadcastHandler):
         my_email = self.config.get("referee_email", "")
 
         # Find game_ids where we are assigned as referee
-        my_game_ids = set()
-        for a in all_assignments:
-            if a.get("role") == "referee" and a.get("email") == my_email:
-                my_game_ids.add(a.get("game_id"))
+        my_game_ids = {
+            a.get("game_id") for a in all_assignments
+            if a.get("role") == "referee" and a.get("email") == my_email
+        }
 
         # Build complete game assignments with all participants
         self.assignments = self._build_game_assignments(all_assignments, my_game_ids)
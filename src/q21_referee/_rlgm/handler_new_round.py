@@ -9,16 +9,21 @@ Looks up assignment for the round and builds GPRM for game execution.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from .handler_base import BaseBroadcastHandler
 from .state_machine import RLGMStateMachine
 from .enums import RLGMEvent
 from .gprm import GPRM
 from .malfunction_detector import detect_malfunctions
+from .new_round_result import NewRoundResult
 
 logger = logging.getLogger("q21_referee.rlgm.handler.new_round")
 
+_REQUIRED_FIELDS = (
+    "player1_email", "player1_id", "player2_email", "player2_id", "game_id",
+)
+
 
 class BroadcastNewRoundHandler(BaseBroadcastHandler):
     """
@@ -50,7 +55,23 @@ class BroadcastNewRoundHandler(BaseBroadcastHandler):
         self.config = config
         self.assignments = assignments
 
-    def handle(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    @property
+    def assignments(self) -> Tuple[Dict[str, Any], ...]:
+        """Assignments for this referee, stored as a tuple.
+
+        Assigning rebuilds the round index. A tuple cannot be changed in
+        place, so the index never goes stale.
+        """
+        return self._assignments
+
+    @assignments.setter
+    def assignments(self, assignments: Sequence[Dict[str, Any]]) -> None:
+        self._assignments = tuple(assignments)
+        self._by_round: Dict[Any, Dict[str, Any]] = {}
+        for assignment in assignments:
+            self._by_round.setdefault(assignment.get("round_number"), assignment)
+
+    def handle(self, message: Dict[str, Any]) -> Optional[NewRoundResult]:
         """
         Handle BROADCAST_NEW_LEAGUE_ROUND message.
 
@@ -58,7 +79,8 @@ class BroadcastNewRoundHandler(BaseBroadcastHandler):
             message: The broadcast message
 
         Returns:
-            Dict with round info, assignment, and GPRM, or None if no assignment
+            NewRoundResult with round info, assignment, GPRM and malfunction,
+            or None if no assignment
         """
         broadcast_id = self.extract_broadcast_id(message)
         payload = self.extract_payload(message)
@@ -93,20 +115,11 @@ class BroadcastNewRoundHandler(BaseBroadcastHandler):
         # Transition to IN_GAME (force=True for out-of-order tolerance)
         self.state_machine.transition(RLGMEvent.ROUND_START, force=True)
 
-        return {
-            "round_number": round_number,
-            "round_id": round_id,
-            "assignment": assignment,
-            "gprm": gprm,
-            "malfunction": malfunction,
-        }
+        return NewRoundResult(round_number, round_id, assignment, gprm, malfunction)
 
     def _get_assignment_for_round(self, round_number: int) -> Optional[Dict[str, Any]]:
         """Find assignment for the given round number."""
-        for assignment in self.assignments:
-            if assignment.get("round_number") == round_number:
-                return assignment
-        return None
+        return self._by_round.get(round_number)
 
     def _build_gprm(
         self, assignment: Dict[str, Any], round_number: int, round_id: str
@@ -115,12 +128,8 @@ class BroadcastNewRoundHandler(BaseBroadcastHandler):
 
         Returns None if required fields are missing or empty.
         """
-        required = [
-            "player1_email", "player1_id",
-            "player2_email", "player2_id", "game_id",
-        ]
-        missing = [f for f in required if not assignment.get(f)]
-        if missing:
+        if not all(assignment.get(f) for f in _REQUIRED_FIELDS):
+            missing = [f for f in _REQUIRED_FIELDS if not assignment.get(f)]
             logger.error(f"Assignment missing required fields: {missing}")
             return None
         return GPRM(
@@ -17,6 +17,11 @@ from .enums import RLGMEvent
 
 logger = logging.getLogger("q21_referee.rlgm.handler.registration")
 
+_STATUS_TO_EVENT = {
+    "accepted": RLGMEvent.REGISTRATION_ACCEPTED,
+    "rejected": RLGMEvent.REGISTRATION_REJECTED,
+}
+
 
 class SeasonRegistrationResponseHandler(BaseBroadcastHandler):
     """
@@ -53,17 +58,17 @@ class SeasonRegistrationResponseHandler(BaseBroadcastHandler):
 
         status = payload.get("status", "").lower()
 
-        if status == "accepted":
-            logger.info("Registration accepted - waiting for assignments")
-            self.state_machine.transition(RLGMEvent.REGISTRATION_ACCEPTED, force=True)
+        event = _STATUS_TO_EVENT.get(status)
+        if event is None:
+            logger.warning(f"Unknown registration status: {status}")
+            return None
 
-        elif status == "rejected":
+        if event is RLGMEvent.REGISTRATION_ACCEPTED:
+            logger.info("Registration accepted - waiting for assignments")
+        else:
             reason = payload.get("reason", "Unknown reason")
             logger.warning(f"Registration rejected: {reason}")
-            self.state_machine.transition(RLGMEvent.REGISTRATION_REJECTED, force=True)
-
-        else:
-            logger.warning(f"Unknown registration status: {status}")
+        self.state_machine.transition(event, force=True)
 
         # No response needed
         return None
@@ -9,7 +9,7 @@ Logs round results and stores them for reference.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .handler_base import BaseBroadcastHandler
 
@@ -29,8 +29,8 @@ class BroadcastRoundResultsHandler(BaseBroadcastHandler):
         """Initialize handler."""
         self.last_round_number: Optional[int] = None
         self.last_round_id: Optional[str] = None
-        self.last_results: List[Dict[str, Any]] = []
-        self.last_standings: List[Dict[str, Any]] = []
+        self.last_results: Tuple[Dict[str, Any], ...] = ()
+        self.last_standings: Tuple[Dict[str, Any], ...] = ()
 
     def handle(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -50,8 +50,8 @@ class BroadcastRoundResultsHandler(BaseBroadcastHandler):
         # Extract round info
         self.last_round_number = payload.get("round_number")
         self.last_round_id = payload.get("round_id", "")
-        self.last_results = payload.get("results", [])
-        self.last_standings = payload.get("standings", [])
+        self.last_results = tuple(payload.get("results", ()))
+        self.last_standings = tuple(payload.get("standings", ()))
 
         # Log results
         logger.info(
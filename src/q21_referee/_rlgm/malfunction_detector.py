@@ -30,25 +30,22 @@ def detect_malfunctions(
     if lookup_table is None:
         return {"status": "NORMAL", "missing_players": []}
 
-    lookup_set = {e.lower() for e in lookup_table}
-    missing, missing_roles = [], []
-
-    if player1_email.lower() not in lookup_set:
-        missing.append(player1_email)
-        missing_roles.append("player1")
-    if player2_email.lower() not in lookup_set:
-        missing.append(player2_email)
-        missing_roles.append("player2")
-
-    if len(missing) == 0:
+    players = {
+        player1_email.lower(): ("player1", player1_email),
+        player2_email.lower(): ("player2", player2_email),
+    }
+    missing = players.keys() - frozenset(map(str.lower, lookup_table))
+    if not missing:
         return {"status": "NORMAL", "missing_players": []}
 
     if len(missing) == 2:
-        return {"status": "CANCELLED", "missing_players": missing}
+        return {"status": "CANCELLED",
+                "missing_players": [player1_email, player2_email]}
 
+    role, email = players[missing.pop()]
     return {
         "status": "SINGLE_PLAYER",
-        "missing_players": missing,
-        "missing_player_role": missing_roles[0],
-        "missing_player_email": missing[0],
+        "missing_players": [email],
+        "missing_player_role": role,
+        "missing_player_email": email,
     }
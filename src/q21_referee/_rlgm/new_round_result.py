@@ -0,0 +1,32 @@
+# Area: RLGM
+# PRD: docs/prd-rlgm.md
+"""
+q21_referee._rlgm.new_round_result — New Round Result
+=====================================================
+
+Defines the NewRoundResult tuple returned by BroadcastNewRoundHandler
+and consumed by the orchestrator to start (or cancel) the round's game.
+"""
+
+from typing import Any, Dict, NamedTuple
+
+from .gprm import GPRM
+
+
+class NewRoundResult(NamedTuple):
+    """
+    Outcome of a BROADCAST_NEW_LEAGUE_ROUND message.
+
+    Attributes:
+        round_number: Numeric round number (0 if the payload was invalid)
+        round_id: Round identifier ("" if absent)
+        assignment: This referee's assignment for the round
+        gprm: Game parameters built from the assignment
+        malfunction: Pre-game malfunction classification
+    """
+
+    round_number: int
+    round_id: str
+    assignment: Dict[str, Any]
+    gprm: GPRM
+    malfunction: Dict[str, Any]
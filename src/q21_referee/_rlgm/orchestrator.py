@@ -10,6 +10,7 @@ from .handler_start_season import BroadcastStartSeasonHandler
 from .handler_registration_response import SeasonRegistrationResponseHandler
 from .handler_assignment import BroadcastAssignmentTableHandler
 from .handler_new_round import BroadcastNewRoundHandler
+from .new_round_result import NewRoundResult
 from .handler_end_round import BroadcastEndRoundHandler
 from .handler_end_season import BroadcastEndSeasonHandler
 from .handler_keep_alive import BroadcastKeepAliveHandler
@@ -80,11 +81,10 @@ class RLGMOrchestrator:
     def get_pending_outgoing(self) -> Msgs:
         msgs, self._pending_outgoing = self._pending_outgoing, []
         return msgs
-    def _handle_new_round(self, result: dict) -> Msgs:
-        gprm = result.get("gprm")
+    def _handle_new_round(self, result: NewRoundResult) -> Msgs:
+        gprm, malf = result.gprm, result.malfunction
         if not gprm:
             return []
-        malf = result.get("malfunction", {})
         if malf.get("status") == "CANCELLED":
             return build_cancel_report(gprm, self.config)
         sp = malf.get("status") == "SINGLE_PLAYER"
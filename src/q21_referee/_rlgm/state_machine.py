@@ -55,6 +55,22 @@ class RLGMStateMachine:
         self.current_state = RLGMState.INIT_START_STATE
         self.saved_state: Optional[RLGMState] = None
 
+    @classmethod
+    def from_state(
+        cls, state: RLGMState, saved_state: Optional[RLGMState] = None
+    ) -> "RLGMStateMachine":
+        """
+        Create a state machine already in a state, without replaying events.
+
+        Args:
+            state: The state to start in
+            saved_state: State to restore on resume, if any
+        """
+        machine = cls()
+        machine.current_state = state
+        machine.saved_state = saved_state
+        return machine
+
     def can_transition(self, event: RLGMEvent) -> bool:
         """
         Check if a transition is valid from current state.
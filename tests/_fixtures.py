@@ -0,0 +1,113 @@
+# Area: Test Configuration
+# PRD: docs/prd-rlgm.md
+"""Shared GPRM, AI and orchestrator fixtures, loaded by conftest.py."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from q21_referee._rlgm.gprm import GPRM
+from q21_referee._rlgm.orchestrator import RLGMOrchestrator
+from q21_referee.callbacks import RefereeAI
+
+
+_GPRM_DEFAULTS = dict(
+    player1_email="p1@test.com", player1_id="P001",
+    player2_email="p2@test.com", player2_id="P002",
+    season_id="S01", game_id="0101001", match_id="M001",
+    round_id="R01", round_number=1,
+)
+
+
+def _make_gprm(**overrides):
+    return GPRM(**{**_GPRM_DEFAULTS, **overrides})
+
+
+@pytest.fixture(scope="session")
+def gprm_template():
+    """Immutable GPRM for orchestrator-level integration tests."""
+    return _make_gprm(match_id="match-1", player1_id="player1",
+                      player2_id="player2")
+
+
+@pytest.fixture(scope="module")
+def gprm():
+    """GMC-level GPRM; frozen, so safe to share across a module."""
+    return _make_gprm(season_id="SEASON_2026_Q1", match_id="R1M1",
+                      round_id="ROUND_1")
+
+
+@pytest.fixture(scope="session")
+def gprm_factory():
+    """Callable building a GPRM from shared defaults plus overrides."""
+    return _make_gprm
+
+
+class _MockRefereeAI(RefereeAI):
+    """Stateless RefereeAI stub returning fixed, valid callback results."""
+
+    def get_warmup_question(self, ctx):
+        return {"warmup_question": "What is 2+2?"}
+
+    def get_round_start_info(self, ctx):
+        return {"book_name": "Test Book", "book_hint": "A test",
+                "association_word": "test"}
+
+    def get_answers(self, ctx):
+        return {"answers": ["A", "B", "C"]}
+
+    def get_score_feedback(self, ctx):
+        return {"league_points": 10, "private_score": 5.0,
+                "breakdown": {}, "feedback": "Good"}
+
+
+@pytest.fixture(scope="session")
+def mock_ai():
+    """Shared stateless RefereeAI stub."""
+    return _MockRefereeAI()
+
+
+@pytest.fixture(scope="session")
+def ai_return_values():
+    """Canned callback results keyed by RefereeAI method name."""
+    return {
+        "get_warmup_question": {"warmup_question": "Hello?"},
+        "get_round_start_info": {
+            "book_name": "T", "book_hint": "H", "association_word": "W",
+        },
+        "get_answers": {"answers": ["A"] * 20},
+        "get_score_feedback": {
+            "league_points": 0, "private_score": 0.0, "breakdown": {},
+        },
+    }
+
+
+@pytest.fixture
+def canned_ai(ai_return_values):
+    """Fresh MagicMock AI wired to the cached canned results."""
+    ai = MagicMock()
+    for name, value in ai_return_values.items():
+        getattr(ai, name).return_value = value
+    return ai
+
+
+@pytest.fixture(scope="session")
+def rlgm_config():
+    """Orchestrator config shared read-only; copy before mutating."""
+    return {
+        "referee_email": "ref@test.com",
+        "referee_id": "ref1",
+        "league_id": "Q21G",
+        "league_manager_email": "lm@test.com",
+        "player_response_timeout_seconds": 40,
+    }
+
+
+@pytest.fixture
+def orch_with_game(rlgm_config, gprm_template, canned_ai):
+    """Orchestrator with a game started — fresh per test (tests abort it)."""
+    orchestrator = RLGMOrchestrator(config=dict(rlgm_config), ai=canned_ai)
+    orchestrator.start_round(gprm_template)
+    return orchestrator
@@ -0,0 +1,43 @@
+# Area: Test Configuration
+# PRD: docs/prd-rlgm.md
+"""Opt-in cProfile plugin: one ``.prof`` file per test call.
+
+Usage:
+    python -m pytest -p tests._profile.conftest_profile \\
+        --profile-dir=.prof tests/test_gmc_wrapper.py
+    python -m pstats .prof/<test>.prof   # then: sort cumtime / stats 20
+"""
+
+from __future__ import annotations
+
+import cProfile
+import re
+from pathlib import Path
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile-dir", default=None,
+        help="write a cProfile dump of each test call into this directory",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Profile only the test body, not fixture setup or teardown."""
+    out_dir = item.config.getoption("--profile-dir")
+    if out_dir is None:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        path = Path(out_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        name = re.sub(r"[^\w.-]+", "_", item.nodeid)
+        profiler.dump_stats(path / f"{name}.prof")
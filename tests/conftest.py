@@ -0,0 +1,69 @@
+# Area: Test Configuration
+# PRD: docs/prd-rlgm.md
+"""Shared pytest configuration for the q21_referee test suite."""
+
+from __future__ import annotations
+
+import logging
+from types import MappingProxyType
+
+import pytest
+
+from q21_referee._gmc.gmc import GameManagementCycle
+from q21_referee._rlgm.enums import RLGMState
+from q21_referee._rlgm.state_machine import RLGMStateMachine
+
+# GPRM, AI and orchestrator fixtures live in tests/_fixtures.py.
+pytest_plugins = ["_fixtures"]
+
+# Handler suites marked ``rlgm_handlers`` are xdist-safe: every state
+# machine is a per-test fixture and shared module fixtures are read-only.
+# ``rlgm_orchestrator`` suites likewise build a fresh orchestrator per test;
+# their module-level caches are per-process, so any worker split is safe.
+
+# Modules that drive a full orchestrator; run them on their own lane.
+SLOW_MODULES = frozenset({"test_deadline_integration", "test_format_abort"})
+
+
+def pytest_collection_modifyitems(config, items):
+    """Tag tests from SLOW_MODULES with the ``slow`` marker."""
+    for item in items:
+        if item.module.__name__.rpartition(".")[2] in SLOW_MODULES:
+            item.add_marker(pytest.mark.slow)
+
+
+@pytest.fixture(scope="module")
+def config():
+    """GMC-level referee config; GMC only reads it, so share a frozen view."""
+    return MappingProxyType({
+        "referee_email": "ref@test.com",
+        "referee_id": "REF001",
+        "league_manager_email": "lm@test.com",
+        "league_id": "LEAGUE001",
+    })
+
+
+@pytest.fixture
+def gmc(gprm, mock_ai, config):
+    """Fresh GameManagementCycle per test; tests mutate its state."""
+    return GameManagementCycle(gprm=gprm, ai=mock_ai, config=config)
+
+
+@pytest.fixture
+def running_sm():
+    """Fresh state machine placed directly in RUNNING."""
+    return RLGMStateMachine.from_state(RLGMState.RUNNING)
+
+
+@pytest.fixture
+def waiting_sm():
+    """Fresh state machine placed directly in WAITING_FOR_ASSIGNMENT."""
+    return RLGMStateMachine.from_state(RLGMState.WAITING_FOR_ASSIGNMENT)
+
+
+@pytest.fixture
+def q21_caplog(caplog, monkeypatch):
+    """caplog capturing every q21_referee record, even after setup_logging()."""
+    monkeypatch.setattr(logging.getLogger("q21_referee"), "propagate", True)
+    caplog.set_level(logging.DEBUG, logger="q21_referee")
+    return caplog
@@ -2,14 +2,16 @@
 # PRD: docs/prd-rlgm.md
 """Tests for abort_handler — resilient scoring during game abort."""
 
-import pytest
+from __future__ import annotations
+
+from types import MappingProxyType
+
 from q21_referee._rlgm.abort_handler import (
     score_player_on_abort,
     determine_abort_winner,
     is_abort_draw,
     build_abort_scores,
 )
-from q21_referee._rlgm.gprm import GPRM
 from q21_referee._gmc.gmc import GameManagementCycle
 from q21_referee.callbacks import RefereeAI
 
@@ -34,35 +36,20 @@ class FailingScoreAI(RefereeAI):
         raise RuntimeError("LLM service unavailable")
 
 
-def _make_config():
-    return {
-        "referee_id": "REF001",
-        "referee_email": "ref@test.com",
-        "group_id": "GROUP_A",
-        "league_id": "LEAGUE001",
-        "season_id": "S01",
-        "league_manager_email": "lm@test.com",
-    }
-
-
-def _make_gprm():
-    return GPRM(
-        player1_email="p1@test.com",
-        player1_id="P001",
-        player2_email="p2@test.com",
-        player2_id="P002",
-        season_id="S01",
-        game_id="0101001",
-        match_id="0101001",
-        round_id="ROUND_1",
-        round_number=1,
-    )
+# Read-only view: the config is shared by every test.
+_CONFIG = MappingProxyType({
+    "referee_id": "REF001",
+    "referee_email": "ref@test.com",
+    "group_id": "GROUP_A",
+    "league_id": "LEAGUE001",
+    "season_id": "S01",
+    "league_manager_email": "lm@test.com",
+})
 
 
-def _make_gmc_with_guess(ai, config):
+def _make_gmc_with_guess(gprm, ai):
     """Create a GMC where player1 has submitted a guess."""
-    gprm = _make_gprm()
-    gmc = GameManagementCycle(gprm, ai, config)
+    gmc = GameManagementCycle(gprm, ai, _CONFIG)
     gmc.state.book_name = "Test Book"
     gmc.state.book_hint = "A test hint"
     gmc.state.association_word = "test"
@@ -79,15 +66,14 @@ def _make_gmc_with_guess(ai, config):
 class TestScorePlayerOnAbortResilience:
     """Test that score_player_on_abort survives callback failures."""
 
-    def test_callback_failure_returns_score_feedback_with_defaults(self):
+    def test_callback_failure_returns_score_feedback_with_defaults(self, gprm):
         """When AI callback raises, should still return Q21SCOREFEEDBACK
         with zero defaults instead of crashing."""
         ai = FailingScoreAI()
-        config = _make_config()
-        gmc = _make_gmc_with_guess(ai, config)
+        gmc = _make_gmc_with_guess(gprm, ai)
         player = gmc.state.player1
 
-        result = score_player_on_abort(gmc, player, ai, config)
+        result = score_player_on_abort(gmc, player, ai, _CONFIG)
 
         # Should return exactly one (envelope, subject, recipient) tuple
         assert len(result) == 1
@@ -98,20 +84,19 @@ class TestScorePlayerOnAbortResilience:
         assert env["payload"]["league_points"] == 0
         assert env["payload"]["private_score"] == 0.0
 
-    def test_callback_failure_sets_player_state_defaults(self):
+    def test_callback_failure_sets_player_state_defaults(self, gprm):
         """When AI callback raises, player state should get zero defaults."""
         ai = FailingScoreAI()
-        config = _make_config()
-        gmc = _make_gmc_with_guess(ai, config)
+        gmc = _make_gmc_with_guess(gprm, ai)
         player = gmc.state.player1
 
-        score_player_on_abort(gmc, player, ai, config)
+        score_player_on_abort(gmc, player, ai, _CONFIG)
 
         assert player.league_points == 0
         assert player.private_score == 0.0
         assert player.score_sent is True
 
-    def test_callback_success_uses_ai_result(self):
+    def test_callback_success_uses_ai_result(self, gprm):
         """When AI callback succeeds, its values should be used."""
 
         class SuccessAI(FailingScoreAI):
@@ -132,11 +117,10 @@ class TestScorePlayerOnAbortResilience:
                 }
 
         ai = SuccessAI()
-        config = _make_config()
-        gmc = _make_gmc_with_guess(ai, config)
+        gmc = _make_gmc_with_guess(gprm, ai)
         player = gmc.state.player1
 
-        result = score_player_on_abort(gmc, player, ai, config)
+        result = score_player_on_abort(gmc, player, ai, _CONFIG)
 
         env, subject, recipient = result[0]
         assert env["payload"]["league_points"] == 2
@@ -148,31 +132,29 @@ class TestScorePlayerOnAbortResilience:
 class TestAbortNoneGuards:
     """Tests for None player guards in abort helper functions."""
 
-    def _make_gmc_with_none_player2(self):
+    def _make_gmc_with_none_player2(self, gprm):
         """Create GMC where player2 is None."""
         ai = FailingScoreAI()
-        config = _make_config()
-        gprm = _make_gprm()
-        gmc = GameManagementCycle(gprm, ai, config)
+        gmc = GameManagementCycle(gprm, ai, _CONFIG)
         gmc.state.player2 = None
         return gmc
 
-    def test_determine_abort_winner_with_none_player(self):
-        gmc = self._make_gmc_with_none_player2()
+    def test_determine_abort_winner_with_none_player(self, gprm):
+        gmc = self._make_gmc_with_none_player2(gprm)
         assert determine_abort_winner(gmc) is None
 
-    def test_is_abort_draw_with_none_player(self):
-        gmc = self._make_gmc_with_none_player2()
+    def test_is_abort_draw_with_none_player(self, gprm):
+        gmc = self._make_gmc_with_none_player2(gprm)
         assert is_abort_draw(gmc) is True
 
-    def test_build_abort_scores_with_none_player(self):
-        gmc = self._make_gmc_with_none_player2()
+    def test_build_abort_scores_with_none_player(self, gprm):
+        gmc = self._make_gmc_with_none_player2(gprm)
         scores = build_abort_scores(gmc)
         assert len(scores) == 1
         assert scores[0]["participant_id"] == "P001"
 
-    def test_build_abort_scores_both_none(self):
-        gmc = self._make_gmc_with_none_player2()
+    def test_build_abort_scores_both_none(self, gprm):
+        gmc = self._make_gmc_with_none_player2(gprm)
         gmc.state.player1 = None
         scores = build_abort_scores(gmc)
         assert len(scores) == 0
@@ -0,0 +1,79 @@
+# Area: RLGM Tests
+# PRD: docs/prd-rlgm.md
+"""Shared contract for the simple broadcast handlers.
+
+Each spec builds one handler on a RUNNING state machine and handles one
+message; the handler must leave the expected state and log at the
+expected level on its own module logger. Handler-specific behaviour
+lives in the per-handler test modules.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from types import MappingProxyType
+
+import pytest
+
+from q21_referee._rlgm.enums import RLGMState
+from q21_referee._rlgm.handler_critical_pause import BroadcastCriticalPauseHandler
+from q21_referee._rlgm.handler_critical_reset import BroadcastCriticalResetHandler
+from q21_referee._rlgm.handler_end_round import BroadcastEndRoundHandler
+from q21_referee._rlgm.handler_end_season import BroadcastEndSeasonHandler
+from q21_referee._rlgm.handler_keep_alive import BroadcastKeepAliveHandler
+from q21_referee._rlgm.response_builder import RLGMResponseBuilder
+
+pytestmark = pytest.mark.rlgm_handlers
+
+
+_KA_CONFIG = MappingProxyType({"referee_id": "REF001"})
+
+
+def _keep_alive_handler(_state_machine):
+    return BroadcastKeepAliveHandler(_KA_CONFIG, RLGMResponseBuilder(_KA_CONFIG))
+
+
+def _msg(message_type, **payload):
+    return MappingProxyType({
+        "message_type": message_type,
+        "broadcast_id": "BC001",
+        "payload": MappingProxyType(payload),
+    })
+
+
+# (handler factory, message, state after handling, handler log level)
+HANDLER_SPECS = [
+    (BroadcastCriticalPauseHandler,
+     _msg("BROADCAST_CRITICAL_PAUSE", reason="Maintenance"),
+     RLGMState.PAUSED, logging.WARNING),
+    (BroadcastCriticalResetHandler,
+     _msg("BROADCAST_CRITICAL_RESET", reason="Cancelled"),
+     RLGMState.INIT_START_STATE, logging.WARNING),
+    (BroadcastEndRoundHandler,
+     _msg("BROADCAST_END_LEAGUE_ROUND", round_number=1, round_id="ROUND_1"),
+     RLGMState.RUNNING, logging.INFO),
+    (BroadcastEndSeasonHandler,
+     _msg("BROADCAST_END_SEASON", season_id="SEASON_2026_Q1"),
+     RLGMState.COMPLETED, logging.INFO),
+    (_keep_alive_handler,
+     _msg("BROADCAST_KEEP_ALIVE", timestamp="2026-01-15T10:00:00Z"),
+     RLGMState.RUNNING, logging.DEBUG),
+]
+
+
+class TestBroadcastHandlerLifecycle:
+    """Each simple broadcast handler on a RUNNING state machine."""
+
+    @pytest.mark.parametrize("handler_spec", HANDLER_SPECS,
+                             ids=[spec[1]["message_type"] for spec in HANDLER_SPECS])
+    def test_handler_lifecycle(self, handler_spec, running_sm, q21_caplog):
+        """Handler reaches its state and logs on its own logger."""
+        factory, message, expected_state, level = handler_spec
+        handler = factory(running_sm)
+        own_logger = sys.modules[type(handler).__module__].logger.name
+
+        handler.handle(message)
+
+        assert running_sm.current_state is expected_state
+        assert (own_logger, level) in {(r.name, r.levelno) for r in q21_caplog.records}
@@ -2,7 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for Broadcast Router."""
 
-import pytest
+from __future__ import annotations
+
 from unittest.mock import Mock, patch
 from q21_referee._rlgm.broadcast_router import BroadcastRouter
 
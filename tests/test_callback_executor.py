@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for callback_executor resilience."""
 
+from __future__ import annotations
+
 import pytest
 from q21_referee._gmc.callback_executor import execute_callback, execute_callback_safe
 from q21_referee.errors import CallbackTimeoutError, InvalidJSONResponseError
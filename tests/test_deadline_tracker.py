@@ -2,10 +2,11 @@
 # PRD: docs/prd-rlgm.md
 """Tests for DeadlineTracker — player response timeout tracking."""
 
-from unittest.mock import patch
+from __future__ import annotations
 
-import pytest
+from unittest.mock import patch
 
+from q21_referee._gmc import deadline_tracker
 from q21_referee._gmc.deadline_tracker import DeadlineTracker
 
 
@@ -105,3 +106,14 @@ class TestDeadlineTracker:
             expired = tracker.check_expired()
             assert len(expired) == 1
             assert expired[0]["player_email"] == "p1@test.com"
+
+    def test_clock_attribute_drives_expiry(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(deadline_tracker, "_clock", lambda: now[0])
+        tracker = DeadlineTracker()
+        tracker.set_deadline("warmup_sent", "p1@test.com", 40)
+
+        now[0] = 139.0
+        assert tracker.check_expired() == []
+        now[0] = 140.0
+        assert [e["player_email"] for e in tracker.check_expired()] == ["p1@test.com"]
@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for DemoAI state management."""
 
+from __future__ import annotations
+
 from unittest.mock import patch
 
 from q21_referee.demo_ai import DemoAI
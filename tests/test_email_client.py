@@ -2,28 +2,54 @@
 # PRD: docs/prd-rlgm.md
 """Tests for email client resilience."""
 
+from __future__ import annotations
+
 from unittest.mock import MagicMock
 
+import pytest
+
 from q21_referee._shared.email_client import EmailClient
 
 
+@pytest.fixture
+def half_client():
+    """EmailClient with attributes set but no OAuth connect performed."""
+    client = EmailClient.__new__(EmailClient)
+    client.credentials_path = "creds.json"
+    client.token_path = "token.json"
+    client.address = "test@test.com"
+    client._credentials = MagicMock()
+    return client
+
+
+class _RaiseService:
+    """Minimal Gmail service stub whose list().execute() raises."""
+
+    def __init__(self, exc):
+        self._exc = exc
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def list(self, *args, **kwargs):
+        return self
+
+    def execute(self):
+        raise self._exc
+
+
 class TestPollResilience:
     """Tests for poll() error recovery."""
 
-    def test_poll_error_resets_service(self):
+    def test_poll_error_resets_service(self, half_client):
         """After a poll error, _service should be None to force reconnect."""
-        client = EmailClient.__new__(EmailClient)
-        client.credentials_path = "creds.json"
-        client.token_path = "token.json"
-        client.address = "test@test.com"
-        client._credentials = MagicMock()
-
-        # Create a mock service that fails on list()
-        mock_service = MagicMock()
-        mock_service.users().messages().list().execute.side_effect = (
-            Exception("API error")
-        )
-        client._service = mock_service
+        client = half_client
+
+        # Service that fails on list()
+        client._service = _RaiseService(Exception("API error"))
 
         # Poll should not crash
         result = client.poll()
@@ -36,13 +62,9 @@ class TestPollResilience:
 class TestNestedAttachmentParsing:
     """Tests for nested attachment handling."""
 
-    def test_nested_parts_passes_message_id(self):
+    def test_nested_parts_passes_message_id(self, half_client):
         """Recursive call should pass original message id for API fetch."""
-        client = EmailClient.__new__(EmailClient)
-        client.credentials_path = "creds.json"
-        client.token_path = "token.json"
-        client.address = "test@test.com"
-        client._credentials = MagicMock()
+        client = half_client
         client._service = MagicMock()
 
         msg = {
@@ -2,39 +2,43 @@
 # PRD: docs/prd-rlgm.md
 """Tests for EnvelopeBuilder — match result, abort fields, falsy guards."""
 
+from __future__ import annotations
+
+import pytest
+
 from q21_referee._gmc.envelope_builder import EnvelopeBuilder
 
 
-def make_builder():
+_EXPECTED_COMPLETED_PAYLOAD = {
+    "match_id": "R1M1",
+    "status": "completed",
+    "winner_id": "P001",
+    "is_draw": False,
+    "scores": [],
+}
+
+
+@pytest.fixture(scope="module")
+def builder():
+    """Shared builder — EnvelopeBuilder holds no per-call state."""
     return EnvelopeBuilder("ref@test.com", "REF001", "L01", "S01")
 
 
 class TestEnvelopeBuilderMatchResult:
     """Tests for build_match_result with abort support."""
 
-    def create_builder(self):
-        return EnvelopeBuilder(
-            referee_email="ref@test.com",
-            referee_id="REF001",
-            league_id="LEAGUE001",
-            season_id="S01",
-        )
-
-    def test_match_result_defaults_to_completed(self):
+    def test_match_result_defaults_to_completed(self, builder):
         """Test that match result defaults to completed status."""
-        builder = self.create_builder()
         env, subject = builder.build_match_result(
             game_id="0101001", match_id="R1M1",
             round_id="ROUND_1", winner_id="P001",
             is_draw=False, scores=[],
         )
-        assert env["payload"]["status"] == "completed"
-        assert "abort_reason" not in env["payload"]
-        assert "player_states" not in env["payload"]
+        # Exact match: completed status, no abort_reason/player_states
+        assert env["payload"] == _EXPECTED_COMPLETED_PAYLOAD
 
-    def test_match_result_aborted(self):
+    def test_match_result_aborted(self, builder):
         """Test that match result includes abort fields."""
-        builder = self.create_builder()
         player_states = {
             "player1": {
                 "phase_reached": "warmup_answered",
@@ -63,9 +67,8 @@ class TestEnvelopeBuilderMatchResult:
 class TestEnvelopeBuilderFalsyFields:
     """Test that falsy but valid values are included."""
 
-    def test_empty_feedback_included(self):
+    def test_empty_feedback_included(self, builder):
         """Empty string feedback should be in score envelope."""
-        builder = make_builder()
         env, _ = builder.build_score_feedback(
             player_id="P001", game_id="0101001", match_id="M01",
             league_points=0, private_score=0.0, breakdown={},
@@ -74,9 +77,8 @@ class TestEnvelopeBuilderFalsyFields:
         assert "feedback" in env["payload"]
         assert env["payload"]["feedback"] == ""
 
-    def test_none_feedback_excluded(self):
+    def test_none_feedback_excluded(self, builder):
         """None feedback should NOT be in score envelope."""
-        builder = make_builder()
         env, _ = builder.build_score_feedback(
             player_id="P001", game_id="0101001", match_id="M01",
             league_points=0, private_score=0.0, breakdown={},
@@ -84,37 +86,32 @@ class TestEnvelopeBuilderFalsyFields:
         )
         assert "feedback" not in env["payload"]
 
-    def test_empty_correlation_id_in_q21(self):
+    def test_empty_correlation_id_in_q21(self, builder):
         """Empty correlation_id should be in Q21 envelope."""
-        builder = make_builder()
         env = builder._base_q21_envelope(
             "TEST", "P001", "0101001", "msg1", correlation_id="")
         assert "correlation_id" in env
 
-    def test_empty_round_id_in_league(self):
+    def test_empty_round_id_in_league(self, builder):
         """Empty round_id should be in league envelope."""
-        builder = make_builder()
         env = builder._base_league_envelope(
             "TEST", "LM", "msg1", round_id="")
         assert "round_id" in env
 
-    def test_empty_game_id_in_league(self):
+    def test_empty_game_id_in_league(self, builder):
         """Empty game_id should be in league envelope."""
-        builder = make_builder()
         env = builder._base_league_envelope(
             "TEST", "LM", "msg1", game_id="")
         assert "game_id" in env
 
-    def test_empty_correlation_id_in_league(self):
+    def test_empty_correlation_id_in_league(self, builder):
         """Empty correlation_id should be in league envelope."""
-        builder = make_builder()
         env = builder._base_league_envelope(
             "TEST", "LM", "msg1", correlation_id="")
         assert "correlation_id" in env
 
-    def test_empty_abort_reason_included(self):
+    def test_empty_abort_reason_included(self, builder):
         """Empty string abort_reason should be in match result."""
-        builder = make_builder()
         env, _ = builder.build_match_result(
             game_id="0101001", match_id="M01", round_id="R01",
             winner_id="P001", is_draw=False, scores=[],
@@ -123,9 +120,8 @@ class TestEnvelopeBuilderFalsyFields:
         assert "abort_reason" in env["payload"]
         assert env["payload"]["abort_reason"] == ""
 
-    def test_empty_player_states_included(self):
+    def test_empty_player_states_included(self, builder):
         """Empty dict player_states should be in match result."""
-        builder = make_builder()
         env, _ = builder.build_match_result(
             game_id="0101001", match_id="M01", round_id="R01",
             winner_id="P001", is_draw=False, scores=[],
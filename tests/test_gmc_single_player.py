@@ -2,142 +2,73 @@
 # PRD: docs/prd-rlgm.md
 """Tests for GMC single-player mode initialization."""
 
+from __future__ import annotations
+
 import pytest
+
 from q21_referee._gmc.gmc import GameManagementCycle
-from q21_referee._rlgm.gprm import GPRM
-from q21_referee.callbacks import RefereeAI
 
 
-class MockRefereeAI(RefereeAI):
-    """Mock AI for testing."""
+class TestGMCNormalMode:
+    """Normal mode: both players active, no single-player flags."""
 
-    def get_warmup_question(self, ctx):
-        return {"warmup_question": "What is 2+2?"}
+    @pytest.fixture(autouse=True)
+    def _setup(self, gprm, config, mock_ai):
+        self.gmc = GameManagementCycle(gprm, mock_ai, config)
 
-    def get_round_start_info(self, ctx):
-        return {"book_name": "Test", "book_hint": "A test", "association_word": "test"}
+    def test_normal_mode_both_players_active(self):
+        assert self.gmc.state.single_player_mode is False
+        assert self.gmc.state.missing_player_role is None
+        assert self.gmc.state.missing_player_email is None
 
-    def get_answers(self, ctx):
-        return {"answers": []}
+    def test_normal_mode_active_players_count(self):
+        assert len(self.gmc.state.active_players()) == 2
 
-    def get_score_feedback(self, ctx):
-        return {"league_points": 0, "private_score": 0.0, "breakdown": {}, "feedback": ""}
 
+_ROLES = [
+    ("player2", "player1", "p2@test.com", "p1@test.com"),
+    ("player1", "player2", "p1@test.com", "p2@test.com"),
+]
 
-def _make_gprm():
-    return GPRM(
-        player1_email="p1@test.com", player1_id="P1",
-        player2_email="p2@test.com", player2_id="P2",
-        season_id="S01", game_id="0101001", match_id="0101001",
-        round_id="S01_R1", round_number=1,
-    )
 
+@pytest.fixture(params=_ROLES, ids=["missing_player2", "missing_player1"])
+def roles(request):
+    """(missing, present, missing_email, present_email) for one case."""
+    return request.param
 
-def _make_config():
-    return {
-        "league_id": "Q21G",
-        "referee_email": "ref@test.com",
-        "referee_id": "REF001",
-    }
 
+@pytest.fixture
+def sp_gmc(gprm, config, mock_ai, roles):
+    return GameManagementCycle(
+        gprm, mock_ai, config,
+        single_player_mode=True, missing_player_role=roles[0],
+    )
 
-class TestGMCNormalMode:
-    """Normal mode: both players active, no single-player flags."""
 
-    def test_normal_mode_both_players_active(self):
-        gmc = GameManagementCycle(_make_gprm(), MockRefereeAI(), _make_config())
-        assert gmc.state.single_player_mode is False
-        assert gmc.state.missing_player_role is None
-        assert gmc.state.missing_player_email is None
+class TestGMCSinglePlayer:
+    """Single-player mode with either player missing."""
 
-    def test_normal_mode_active_players_count(self):
-        gmc = GameManagementCycle(_make_gprm(), MockRefereeAI(), _make_config())
-        assert len(gmc.state.active_players()) == 2
-
-
-class TestGMCSinglePlayerMissingPlayer2:
-    """Single-player mode with player2 missing."""
-
-    def test_single_player_flag_set(self):
-        gmc = GameManagementCycle(
-            _make_gprm(), MockRefereeAI(), _make_config(),
-            single_player_mode=True, missing_player_role="player2",
-        )
-        assert gmc.state.single_player_mode is True
-        assert gmc.state.missing_player_role == "player2"
-        assert gmc.state.missing_player_email == "p2@test.com"
-
-    def test_missing_player_state_prefilled(self):
-        gmc = GameManagementCycle(
-            _make_gprm(), MockRefereeAI(), _make_config(),
-            single_player_mode=True, missing_player_role="player2",
-        )
-        p2 = gmc.state.player2
-        assert p2.warmup_answer == "ABSENT_MALFUNCTION"
-        assert p2.answers_sent is True
-        assert p2.score_sent is True
-        assert p2.league_points == 1
-
-    def test_active_players_excludes_missing(self):
-        gmc = GameManagementCycle(
-            _make_gprm(), MockRefereeAI(), _make_config(),
-            single_player_mode=True, missing_player_role="player2",
-        )
-        active = gmc.state.active_players()
-        assert len(active) == 1
-        assert active[0].email == "p1@test.com"
-
-    def test_present_player_state_untouched(self):
-        gmc = GameManagementCycle(
-            _make_gprm(), MockRefereeAI(), _make_config(),
-            single_player_mode=True, missing_player_role="player2",
-        )
-        p1 = gmc.state.player1
-        assert p1.warmup_answer is None
-        assert p1.answers_sent is False
-        assert p1.score_sent is False
-        assert p1.league_points == 0
-
-
-class TestGMCSinglePlayerMissingPlayer1:
-    """Single-player mode with player1 missing."""
-
-    def test_single_player_flag_set(self):
-        gmc = GameManagementCycle(
-            _make_gprm(), MockRefereeAI(), _make_config(),
-            single_player_mode=True, missing_player_role="player1",
-        )
-        assert gmc.state.single_player_mode is True
-        assert gmc.state.missing_player_role == "player1"
-        assert gmc.state.missing_player_email == "p1@test.com"
-
-    def test_missing_player_state_prefilled(self):
-        gmc = GameManagementCycle(
-            _make_gprm(), MockRefereeAI(), _make_config(),
-            single_player_mode=True, missing_player_role="player1",
-        )
-        p1 = gmc.state.player1
-        assert p1.warmup_answer == "ABSENT_MALFUNCTION"
-        assert p1.answers_sent is True
-        assert p1.score_sent is True
-        assert p1.league_points == 1
-
-    def test_active_players_excludes_missing(self):
-        gmc = GameManagementCycle(
-            _make_gprm(), MockRefereeAI(), _make_config(),
-            single_player_mode=True, missing_player_role="player1",
-        )
-        active = gmc.state.active_players()
+    def test_single_player_flag_set(self, sp_gmc, roles):
+        missing, _present, missing_email, _present_email = roles
+        assert sp_gmc.state.single_player_mode is True
+        assert sp_gmc.state.missing_player_role == missing
+        assert sp_gmc.state.missing_player_email == missing_email
+
+    def test_missing_player_state_prefilled(self, sp_gmc, roles):
+        player = getattr(sp_gmc.state, roles[0])
+        assert player.warmup_answer == "ABSENT_MALFUNCTION"
+        assert player.answers_sent is True
+        assert player.score_sent is True
+        assert player.league_points == 1
+
+    def test_active_players_excludes_missing(self, sp_gmc, roles):
+        active = sp_gmc.state.active_players()
         assert len(active) == 1
-        assert active[0].email == "p2@test.com"
-
-    def test_present_player_state_untouched(self):
-        gmc = GameManagementCycle(
-            _make_gprm(), MockRefereeAI(), _make_config(),
-            single_player_mode=True, missing_player_role="player1",
-        )
-        p2 = gmc.state.player2
-        assert p2.warmup_answer is None
-        assert p2.answers_sent is False
-        assert p2.score_sent is False
-        assert p2.league_points == 0
+        assert active[0].email == roles[3]
+
+    def test_present_player_state_untouched(self, sp_gmc, roles):
+        player = getattr(sp_gmc.state, roles[1])
+        assert player.warmup_answer is None
+        assert player.answers_sent is False
+        assert player.score_sent is False
+        assert player.league_points == 0
@@ -2,107 +2,56 @@
 # PRD: docs/prd-rlgm.md
 """Tests for GMC Wrapper Class."""
 
-import pytest
-from unittest.mock import Mock
-from q21_referee._gmc.gmc import GameManagementCycle
-from q21_referee._rlgm.gprm import GPRM
-from q21_referee._rlgm.game_result import GameResult
-from q21_referee.callbacks import RefereeAI
-
+from __future__ import annotations
 
-class MockRefereeAI(RefereeAI):
-    """Mock AI for testing."""
+from unittest.mock import Mock
 
-    def get_warmup_question(self, ctx):
-        return {"warmup_question": "What is 2+2?"}
+from q21_referee._gmc.state import GamePhase
+from q21_referee._rlgm.game_result import GameResult
 
-    def get_round_start_info(self, ctx):
-        return {"book_name": "Test Book", "book_hint": "A test", "association_word": "test"}
 
-    def get_answers(self, ctx):
-        return {"answers": ["A", "B", "C"]}
+def _assert_subset(expected: dict, actual: dict, path: str = "") -> None:
+    """Assert ``expected`` is a nested subset of ``actual``.
 
-    def get_score_feedback(self, ctx):
-        return {"league_points": 10, "private_score": 5.0, "breakdown": {}, "feedback": "Good"}
+    Every expected key must be present; booleans and None are compared
+    with ``is`` so that 0 or a missing value cannot stand in for them.
+    """
+    for key, value in expected.items():
+        where = f"{path}{key}"
+        assert key in actual, f"missing {where}"
+        if isinstance(value, dict):
+            _assert_subset(value, actual[key], f"{where}.")
+        elif value is None or isinstance(value, bool):
+            assert actual[key] is value, f"{where}: {actual[key]!r} is not {value!r}"
+        else:
+            assert actual[key] == value, f"{where}: {actual[key]!r} != {value!r}"
 
 
 class TestGameManagementCycle:
     """Tests for GameManagementCycle wrapper."""
 
-    def create_gprm(self):
-        """Create sample GPRM."""
-        return GPRM(
-            player1_email="p1@test.com",
-            player1_id="P001",
-            player2_email="p2@test.com",
-            player2_id="P002",
-            season_id="SEASON_2026_Q1",
-            game_id="0101001",
-            match_id="R1M1",
-            round_id="ROUND_1",
-            round_number=1,
-        )
-
-    def create_config(self):
-        """Create sample config."""
-        return {
-            "referee_email": "ref@test.com",
-            "referee_id": "REF001",
-            "league_manager_email": "lm@test.com",
-            "league_id": "LEAGUE001",
-        }
-
-    def test_gmc_accepts_gprm(self):
+    def test_gmc_accepts_gprm(self, gmc, gprm):
         """Test that GMC can be created with GPRM."""
-        gprm = self.create_gprm()
-        config = self.create_config()
-        ai = MockRefereeAI()
-
-        gmc = GameManagementCycle(gprm=gprm, ai=ai, config=config)
-
         assert gmc.gprm == gprm
         assert gmc.state.game_id == "0101001"
         assert gmc.state.player1.email == "p1@test.com"
 
-    def test_gmc_get_result_before_complete_returns_none(self):
+    def test_gmc_get_result_before_complete_returns_none(self, gmc):
         """Test that get_result returns None before game completes."""
-        gprm = self.create_gprm()
-        config = self.create_config()
-        ai = MockRefereeAI()
-
-        gmc = GameManagementCycle(gprm=gprm, ai=ai, config=config)
-
         result = gmc.get_result()
         assert result is None
 
-    def test_gmc_is_complete_false_initially(self):
+    def test_gmc_is_complete_false_initially(self, gmc):
         """Test that is_complete returns False initially."""
-        gprm = self.create_gprm()
-        config = self.create_config()
-        ai = MockRefereeAI()
-
-        gmc = GameManagementCycle(gprm=gprm, ai=ai, config=config)
-
         assert gmc.is_complete() is False
 
-    def test_gmc_route_unknown_message_returns_empty(self):
+    def test_gmc_route_unknown_message_returns_empty(self, gmc):
         """Test that routing unknown message type returns empty list."""
-        gprm = self.create_gprm()
-        config = self.create_config()
-        ai = MockRefereeAI()
-        gmc = GameManagementCycle(gprm=gprm, ai=ai, config=config)
-
         outgoing = gmc.route_message("UNKNOWN_TYPE", {}, "someone@test.com")
         assert outgoing == []
 
-    def test_gmc_builds_game_result_on_complete(self):
+    def test_gmc_builds_game_result_on_complete(self, gmc):
         """Test that GMC builds GameResult when match completes."""
-        gprm = self.create_gprm()
-        config = self.create_config()
-        ai = MockRefereeAI()
-
-        gmc = GameManagementCycle(gprm=gprm, ai=ai, config=config)
-
         # Simulate full game flow would be complex, so we test the result building
         # by manually setting state and calling the internal method
         gmc.state.player1.league_points = 15
@@ -120,51 +69,38 @@ class TestGameManagementCycle:
         assert result.player1.score == 15
         assert result.player2.score == 10
 
-    def test_get_state_snapshot_idle(self):
+    def test_get_state_snapshot_idle(self, gmc):
         """Test snapshot at IDLE phase."""
-        gprm = self.create_gprm()
-        config = self.create_config()
-        ai = MockRefereeAI()
-        gmc = GameManagementCycle(gprm=gprm, ai=ai, config=config)
-
         snapshot = gmc.get_state_snapshot()
 
-        assert snapshot["game_id"] == "0101001"
-        assert snapshot["phase"] == "idle"
-        assert snapshot["player1"]["email"] == "p1@test.com"
-        assert snapshot["player1"]["participant_id"] == "P001"
-        assert snapshot["player1"]["phase_reached"] == "idle"
-        assert snapshot["player1"]["scored"] is False
-        assert snapshot["player1"]["last_actor"] == "referee"
-        assert snapshot["player2"]["last_actor"] == "referee"
-
-    def test_get_state_snapshot_warmup_one_responded(self):
+        _assert_subset({
+            "game_id": "0101001",
+            "phase": "idle",
+            "player1": {
+                "email": "p1@test.com",
+                "participant_id": "P001",
+                "phase_reached": "idle",
+                "scored": False,
+                "last_actor": "referee",
+            },
+            "player2": {"last_actor": "referee"},
+        }, snapshot)
+
+    def test_get_state_snapshot_warmup_one_responded(self, gmc):
         """Test snapshot when one player responded to warmup."""
-        gprm = self.create_gprm()
-        config = self.create_config()
-        ai = MockRefereeAI()
-        gmc = GameManagementCycle(gprm=gprm, ai=ai, config=config)
-
-        from q21_referee._gmc.state import GamePhase
         gmc.state.phase = GamePhase.WARMUP_SENT
         gmc.state.player1.warmup_answer = "4"
 
         snapshot = gmc.get_state_snapshot()
 
-        assert snapshot["phase"] == "warmup_sent"
-        assert snapshot["player1"]["phase_reached"] == "warmup_answered"
-        assert snapshot["player1"]["last_actor"] == "P001"
-        assert snapshot["player2"]["phase_reached"] == "warmup_sent"
-        assert snapshot["player2"]["last_actor"] == "referee"
+        _assert_subset({
+            "phase": "warmup_sent",
+            "player1": {"phase_reached": "warmup_answered", "last_actor": "P001"},
+            "player2": {"phase_reached": "warmup_sent", "last_actor": "referee"},
+        }, snapshot)
 
-    def test_get_state_snapshot_scored(self):
+    def test_get_state_snapshot_scored(self, gmc):
         """Test snapshot when one player has been scored."""
-        gprm = self.create_gprm()
-        config = self.create_config()
-        ai = MockRefereeAI()
-        gmc = GameManagementCycle(gprm=gprm, ai=ai, config=config)
-
-        from q21_referee._gmc.state import GamePhase
         gmc.state.phase = GamePhase.SCORING_COMPLETE
         gmc.state.player1.score_sent = True
         gmc.state.player1.league_points = 10
@@ -173,8 +109,11 @@ class TestGameManagementCycle:
 
         snapshot = gmc.get_state_snapshot()
 
-        assert snapshot["player1"]["scored"] is True
-        assert snapshot["player1"]["phase_reached"] == "scored"
-        assert snapshot["player2"]["scored"] is False
-        assert snapshot["player2"]["phase_reached"] == "guess_submitted"
-        assert snapshot["player2"]["last_actor"] == "P002"
+        _assert_subset({
+            "player1": {"scored": True, "phase_reached": "scored"},
+            "player2": {
+                "scored": False,
+                "phase_reached": "guess_submitted",
+                "last_actor": "P002",
+            },
+        }, snapshot)
@@ -2,6 +2,10 @@
 # PRD: docs/prd-rlgm.md
 """Tests for GPRM (Game Parameters) dataclass."""
 
+from __future__ import annotations
+
+import dataclasses
+
 import pytest
 from q21_referee._rlgm.gprm import GPRM
 
@@ -11,7 +15,7 @@ class TestGPRM:
 
     def test_gprm_creation(self):
         """Test that GPRM can be created with all fields."""
-        gprm = GPRM(
+        expected = dict(
             player1_email="player1@test.com",
             player1_id="P001",
             player2_email="player2@test.com",
@@ -22,15 +26,8 @@ class TestGPRM:
             round_id="ROUND_1",
             round_number=1,
         )
-        assert gprm.player1_email == "player1@test.com"
-        assert gprm.player1_id == "P001"
-        assert gprm.player2_email == "player2@test.com"
-        assert gprm.player2_id == "P002"
-        assert gprm.season_id == "SEASON_2026_Q1"
-        assert gprm.game_id == "0101001"
-        assert gprm.match_id == "R1M1"
-        assert gprm.round_id == "ROUND_1"
-        assert gprm.round_number == 1
+        gprm = GPRM(**expected)
+        assert dataclasses.asdict(gprm) == expected
 
     def test_gprm_all_fields_required(self):
         """Test that GPRM requires all 9 fields."""
@@ -98,3 +95,9 @@ class TestGPRM:
         assert gprm in game_set
         game_dict = {gprm: "test_game"}
         assert game_dict[gprm] == "test_game"
+
+    def test_gprm_is_slotted(self, gprm_factory):
+        """GPRM instances use __slots__ instead of a per-instance __dict__."""
+        gprm = gprm_factory()
+        assert not hasattr(gprm, "__dict__")
+        assert set(GPRM.__slots__) == {f.name for f in dataclasses.fields(GPRM)}
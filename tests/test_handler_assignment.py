@@ -8,76 +8,92 @@ Tests use the actual UNIFIED_PROTOCOL.md format:
 - Referee is identified by matching email
 """
 
+from __future__ import annotations
+
 import pytest
 from q21_referee._rlgm.handler_assignment import BroadcastAssignmentTableHandler
-from q21_referee._rlgm.state_machine import RLGMStateMachine
-from q21_referee._rlgm.enums import RLGMState, RLGMEvent
+from q21_referee._rlgm.enums import RLGMState
+
+pytestmark = pytest.mark.rlgm_handlers
+
+
+_RUNNING, _WAITING = RLGMState.RUNNING, RLGMState.WAITING_FOR_ASSIGNMENT
+
+_ASSIGNMENT_FIELDS = ("role", "email", "game_id", "group_id")
+
+_ASSIGNMENTS_RAW = (
+    # Game 0101001: Round 1, Game 1 - referee@test.com is referee
+    ("player1", "p1@test.com", "0101001", "G002"),
+    ("player2", "p2@test.com", "0101001", "G003"),
+    ("referee", "referee@test.com", "0101001", "G001"),
+    # Game 0101002: Round 1, Game 2 - different referee
+    ("player1", "p3@test.com", "0101002", "G004"),
+    ("player2", "p4@test.com", "0101002", "G005"),
+    ("referee", "other@test.com", "0101002", "G006"),
+    # Game 0102001: Round 2, Game 1 - referee@test.com is referee
+    ("player1", "p1@test.com", "0102001", "G002"),
+    ("player2", "p3@test.com", "0102001", "G004"),
+    ("referee", "referee@test.com", "0102001", "G001"),
+)
+
+
+@pytest.fixture(scope="module")
+def assignment_message():
+    """Create sample assignment table message per UNIFIED_PROTOCOL.md §5.6.
+
+    Format: each role is a separate entry with game_id SSRRGGG.
+    The handler only reads the message, so one copy serves the module.
+    """
+    return {
+        "message_type": "BROADCAST_ASSIGNMENT_TABLE",
+        "broadcast_id": "BC002",
+        "league_id": "LEAGUE001",
+        "payload": {
+            "broadcast_id": "bc-assign-001",
+            "season_id": "SEASON_2026_Q1",
+            "league_id": "LEAGUE001",
+            "assignments": [
+                dict(zip(_ASSIGNMENT_FIELDS, row)) for row in _ASSIGNMENTS_RAW
+            ],
+            "total_count": 9,
+            "message_text": "Season assignments are ready!",
+        },
+    }
+
+
+@pytest.fixture
+def handler_and_sm(request, waiting_sm):
+    """Handler with state machine in WAITING_FOR_ASSIGNMENT.
+
+    The referee email defaults to referee@test.com; override it with
+    indirect parametrization.
+    """
+    config = {
+        "referee_id": "REF001",
+        "group_id": "G001",
+        "referee_email": getattr(request, "param", "referee@test.com"),
+    }
+    handler = BroadcastAssignmentTableHandler(waiting_sm, config)
+    return handler, waiting_sm
 
 
 class TestBroadcastAssignmentTableHandler:
     """Tests for BroadcastAssignmentTableHandler."""
 
-    def create_handler_in_waiting_state(self, referee_email="referee@test.com"):
-        """Create handler with state machine in WAITING_FOR_ASSIGNMENT."""
-        state_machine = RLGMStateMachine()
-        state_machine.transition(RLGMEvent.SEASON_START)
-        state_machine.transition(RLGMEvent.REGISTRATION_ACCEPTED)
-        config = {
-            "referee_id": "REF001",
-            "group_id": "G001",
-            "referee_email": referee_email,
-        }
-        handler = BroadcastAssignmentTableHandler(state_machine, config)
-        return handler, state_machine
-
-    def create_assignment_message(self):
-        """Create sample assignment table message per UNIFIED_PROTOCOL.md §5.6.
-
-        Format: each role is a separate entry with game_id SSRRGGG.
-        """
-        return {
-            "message_type": "BROADCAST_ASSIGNMENT_TABLE",
-            "broadcast_id": "BC002",
-            "league_id": "LEAGUE001",
-            "payload": {
-                "broadcast_id": "bc-assign-001",
-                "season_id": "SEASON_2026_Q1",
-                "league_id": "LEAGUE001",
-                "assignments": [
-                    # Game 0101001: Round 1, Game 1 - referee@test.com is referee
-                    {"role": "player1", "email": "p1@test.com", "game_id": "0101001", "group_id": "G002"},
-                    {"role": "player2", "email": "p2@test.com", "game_id": "0101001", "group_id": "G003"},
-                    {"role": "referee", "email": "referee@test.com", "game_id": "0101001", "group_id": "G001"},
-                    # Game 0101002: Round 1, Game 2 - different referee
-                    {"role": "player1", "email": "p3@test.com", "game_id": "0101002", "group_id": "G004"},
-                    {"role": "player2", "email": "p4@test.com", "game_id": "0101002", "group_id": "G005"},
-                    {"role": "referee", "email": "other@test.com", "game_id": "0101002", "group_id": "G006"},
-                    # Game 0102001: Round 2, Game 1 - referee@test.com is referee
-                    {"role": "player1", "email": "p1@test.com", "game_id": "0102001", "group_id": "G002"},
-                    {"role": "player2", "email": "p3@test.com", "game_id": "0102001", "group_id": "G004"},
-                    {"role": "referee", "email": "referee@test.com", "game_id": "0102001", "group_id": "G001"},
-                ],
-                "total_count": 9,
-                "message_text": "Season assignments are ready!",
-            },
-        }
-
-    def test_extracts_assignments_from_payload(self):
+    def test_extracts_assignments_from_payload(self, handler_and_sm, assignment_message):
         """Test that assignments are extracted from payload."""
-        handler, _ = self.create_handler_in_waiting_state()
-        message = self.create_assignment_message()
+        handler, _ = handler_and_sm
 
-        result = handler.handle(message)
+        result = handler.handle(assignment_message)
 
         # Handler should have processed assignments
         assert result is not None
 
-    def test_filters_by_referee_email(self):
+    def test_filters_by_referee_email(self, handler_and_sm, assignment_message):
         """Test that only games where we are referee are kept."""
-        handler, _ = self.create_handler_in_waiting_state(referee_email="referee@test.com")
-        message = self.create_assignment_message()
+        handler, _ = handler_and_sm
 
-        handler.handle(message)
+        handler.handle(assignment_message)
 
         # Should have 2 games where referee@test.com is referee
         assert len(handler.assignments) == 2
@@ -85,24 +101,39 @@ class TestBroadcastAssignmentTableHandler:
         game_ids = {a["game_id"] for a in handler.assignments}
         assert game_ids == {"0101001", "0102001"}
 
-    def test_parses_round_from_game_id(self):
+    def test_filters_large_table(self, handler_and_sm):
+        """Only our games survive filtering of a season-sized table."""
+        handler, _ = handler_and_sm
+        rows = [
+            dict(zip(_ASSIGNMENT_FIELDS, (role, email, f"0101{n:03d}", "G")))
+            for n in range(1, 1000)
+            for role, email in (("player1", "p1@test.com"),
+                                ("player2", "p2@test.com"),
+                                ("referee", "referee@test.com" if n % 10 == 0
+                                 else "other@test.com"))
+        ]
+
+        handler.handle({"payload": {"assignments": rows}})
+
+        game_ids = [a["game_id"] for a in handler.assignments]
+        assert sorted(game_ids) == [f"0101{n:03d}" for n in range(10, 1000, 10)]
+
+    def test_parses_round_from_game_id(self, handler_and_sm, assignment_message):
         """Test that round_number is parsed from game_id[2:4]."""
-        handler, _ = self.create_handler_in_waiting_state()
-        message = self.create_assignment_message()
+        handler, _ = handler_and_sm
 
-        handler.handle(message)
+        handler.handle(assignment_message)
 
         # Game 0101001 should be round 1, game 0102001 should be round 2
         rounds = {a["game_id"]: a["round_number"] for a in handler.assignments}
         assert rounds["0101001"] == 1
         assert rounds["0102001"] == 2
 
-    def test_builds_complete_game_assignments(self):
+    def test_builds_complete_game_assignments(self, handler_and_sm, assignment_message):
         """Test that player info is aggregated into game assignments."""
-        handler, _ = self.create_handler_in_waiting_state()
-        message = self.create_assignment_message()
+        handler, _ = handler_and_sm
 
-        handler.handle(message)
+        handler.handle(assignment_message)
 
         # Find the round 1 game
         game_r1 = next(a for a in handler.assignments if a["game_id"] == "0101001")
@@ -111,47 +142,44 @@ class TestBroadcastAssignmentTableHandler:
         assert game_r1["player1_id"] == "G002"
         assert game_r1["player2_id"] == "G003"
 
-    def test_triggers_state_transition(self):
+    def test_triggers_state_transition(self, handler_and_sm, assignment_message):
         """Test that handler triggers ASSIGNMENT_RECEIVED transition."""
-        handler, state_machine = self.create_handler_in_waiting_state()
-        assert state_machine.current_state == RLGMState.WAITING_FOR_ASSIGNMENT
+        handler, state_machine = handler_and_sm
+        assert state_machine.current_state is _WAITING
 
-        handler.handle(self.create_assignment_message())
+        handler.handle(assignment_message)
 
-        assert state_machine.current_state == RLGMState.RUNNING
+        assert state_machine.current_state is _RUNNING
 
-    def test_returns_acknowledgment(self):
+    def test_returns_acknowledgment(self, handler_and_sm, assignment_message):
         """Test that handler returns RESPONSE_GROUP_ASSIGNMENT."""
-        handler, _ = self.create_handler_in_waiting_state()
-        message = self.create_assignment_message()
+        handler, _ = handler_and_sm
 
-        result = handler.handle(message)
+        result = handler.handle(assignment_message)
 
         assert result is not None
         assert result["message_type"] == "RESPONSE_GROUP_ASSIGNMENT"
         assert result["payload"]["status"] == "acknowledged"
         assert result["payload"]["assignments_received"] == 2
 
-    def test_no_matching_assignments(self):
+    @pytest.mark.parametrize(
+        "handler_and_sm", ["unknown@test.com"], indirect=True)
+    def test_no_matching_assignments(self, handler_and_sm, assignment_message):
         """Test handling when no assignments match our referee email."""
-        handler, state_machine = self.create_handler_in_waiting_state(
-            referee_email="unknown@test.com"
-        )
-        message = self.create_assignment_message()
+        handler, state_machine = handler_and_sm
 
-        result = handler.handle(message)
+        result = handler.handle(assignment_message)
 
         # Should still acknowledge but with 0 assignments
         assert result["payload"]["assignments_received"] == 0
         # State should not transition if no assignments
-        assert state_machine.current_state == RLGMState.WAITING_FOR_ASSIGNMENT
+        assert state_machine.current_state is _WAITING
 
-    def test_get_assignment_for_round(self):
+    def test_get_assignment_for_round(self, handler_and_sm, assignment_message):
         """Test getting assignment for a specific round number."""
-        handler, _ = self.create_handler_in_waiting_state()
-        message = self.create_assignment_message()
+        handler, _ = handler_and_sm
 
-        handler.handle(message)
+        handler.handle(assignment_message)
 
         # Should find round 1 assignment
         r1 = handler.get_assignment_for_round(1)
@@ -167,9 +195,9 @@ class TestBroadcastAssignmentTableHandler:
         r3 = handler.get_assignment_for_round(3)
         assert r3 is None
 
-    def test_handles_invalid_game_id_format(self):
+    def test_handles_invalid_game_id_format(self, handler_and_sm):
         """Test handling when game_id is too short to parse round_number."""
-        handler, _ = self.create_handler_in_waiting_state()
+        handler, _ = handler_and_sm
         message = {
             "message_type": "BROADCAST_ASSIGNMENT_TABLE",
             "broadcast_id": "BC002",
@@ -188,9 +216,9 @@ class TestBroadcastAssignmentTableHandler:
         assert len(handler.assignments) == 1
         assert handler.assignments[0]["round_number"] == 0
 
-    def test_handles_non_numeric_game_id(self):
+    def test_handles_non_numeric_game_id(self, handler_and_sm):
         """Test handling when game_id has non-numeric round portion."""
-        handler, _ = self.create_handler_in_waiting_state()
+        handler, _ = handler_and_sm
         message = {
             "message_type": "BROADCAST_ASSIGNMENT_TABLE",
             "broadcast_id": "BC002",
@@ -2,7 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for Handler Base Class."""
 
-import pytest
+from __future__ import annotations
+
 from typing import Any, Dict, Optional
 from q21_referee._rlgm.handler_base import BaseBroadcastHandler
 
@@ -2,79 +2,67 @@
 # PRD: docs/prd-rlgm.md
 """Tests for BROADCAST_CRITICAL_PAUSE handler."""
 
+from __future__ import annotations
+
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import patch, Mock
+
 from q21_referee._rlgm.handler_critical_pause import BroadcastCriticalPauseHandler
-from q21_referee._rlgm.state_machine import RLGMStateMachine
-from q21_referee._rlgm.enums import RLGMState, RLGMEvent
+from q21_referee._rlgm.enums import RLGMState
 
+pytestmark = pytest.mark.rlgm_handlers
 
-class TestBroadcastCriticalPauseHandler:
-    """Tests for BroadcastCriticalPauseHandler."""
 
-    def create_handler_in_running_state(self):
-        """Create handler with state machine in RUNNING state."""
-        state_machine = RLGMStateMachine()
-        state_machine.transition(RLGMEvent.SEASON_START)
-        state_machine.transition(RLGMEvent.REGISTRATION_ACCEPTED)
-        state_machine.transition(RLGMEvent.ASSIGNMENT_RECEIVED)
-        handler = BroadcastCriticalPauseHandler(state_machine)
-        return handler, state_machine
+_RUNNING, _PAUSED = RLGMState.RUNNING, RLGMState.PAUSED
 
-    def create_pause_message(self, reason="System maintenance"):
-        """Create sample critical pause message."""
-        return {
-            "message_type": "BROADCAST_CRITICAL_PAUSE",
-            "broadcast_id": "CP001",
-            "payload": {
-                "reason": reason,
-                "timestamp": "2026-01-15T10:00:00Z",
-            },
-        }
+_PAUSE_MSG = MappingProxyType({
+    "message_type": "BROADCAST_CRITICAL_PAUSE",
+    "broadcast_id": "CP001",
+    "payload": MappingProxyType({
+        "reason": "System maintenance",
+        "timestamp": "2026-01-15T10:00:00Z",
+    }),
+})
 
-    def test_pauses_state_machine(self):
-        """Test that handler pauses the state machine."""
-        handler, state_machine = self.create_handler_in_running_state()
-        assert state_machine.current_state == RLGMState.RUNNING
 
-        handler.handle(self.create_pause_message())
+def _pause_message(reason):
+    """Read-only copy of _PAUSE_MSG with only the reason replaced."""
+    payload = MappingProxyType({**_PAUSE_MSG["payload"], "reason": reason})
+    return MappingProxyType({**_PAUSE_MSG, "payload": payload})
 
-        assert state_machine.current_state == RLGMState.PAUSED
-        assert state_machine.saved_state == RLGMState.RUNNING
 
-    def test_stores_pause_reason(self):
-        """Test that pause reason is stored."""
-        handler, _ = self.create_handler_in_running_state()
+@pytest.fixture
+def handler(running_sm):
+    """Handler bound to the per-test RUNNING state machine."""
+    return BroadcastCriticalPauseHandler(running_sm)
 
-        handler.handle(self.create_pause_message(reason="Emergency stop"))
 
-        assert handler.pause_reason == "Emergency stop"
+class TestBroadcastCriticalPauseHandler:
+    """Tests for BroadcastCriticalPauseHandler."""
 
-    def test_returns_none(self):
-        """Test that handler returns None (no response needed)."""
-        handler, _ = self.create_handler_in_running_state()
+    @pytest.mark.parametrize("message, reason", [
+        (_PAUSE_MSG, "System maintenance"),
+        (_pause_message("Emergency stop"), "Emergency stop"),
+    ], ids=["default_reason", "custom_reason"])
+    def test_pause_behavior(self, handler, running_sm, message, reason):
+        """Pause saves RUNNING, stores the reason and needs no response."""
+        assert running_sm.current_state is _RUNNING
 
-        result = handler.handle(self.create_pause_message())
+        result = handler.handle(message)
 
         assert result is None
+        assert running_sm.current_state is _PAUSED
+        assert running_sm.saved_state is _RUNNING
+        assert handler.pause_reason == reason
 
-    def test_logs_pause(self):
-        """Test that pause is logged."""
-        handler, _ = self.create_handler_in_running_state()
-
-        with patch("q21_referee._rlgm.handler_critical_pause.logger") as mock_logger:
-            handler.handle(self.create_pause_message())
-            mock_logger.warning.assert_called()
-
-    def test_already_paused_is_noop(self):
+    def test_already_paused_is_noop(self, handler, running_sm):
         """Test that pausing when already paused does nothing."""
-        handler, state_machine = self.create_handler_in_running_state()
-
         # First pause
-        handler.handle(self.create_pause_message())
-        assert state_machine.current_state == RLGMState.PAUSED
-        saved = state_machine.saved_state
+        handler.handle(_PAUSE_MSG)
+        assert running_sm.current_state is _PAUSED
+        saved = running_sm.saved_state
 
         # Second pause should not change saved state
-        handler.handle(self.create_pause_message())
-        assert state_machine.saved_state == saved
+        handler.handle(_PAUSE_MSG)
+        assert running_sm.saved_state == saved
@@ -2,81 +2,70 @@
 # PRD: docs/prd-rlgm.md
 """Tests for BROADCAST_CRITICAL_RESET handler."""
 
+from __future__ import annotations
+
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import patch
+
 from q21_referee._rlgm.handler_critical_reset import BroadcastCriticalResetHandler
 from q21_referee._rlgm.state_machine import RLGMStateMachine
 from q21_referee._rlgm.enums import RLGMState, RLGMEvent
 
+pytestmark = pytest.mark.rlgm_handlers
 
-class TestBroadcastCriticalResetHandler:
-    """Tests for BroadcastCriticalResetHandler."""
 
-    def create_handler_in_running_state(self):
-        """Create handler with state machine in RUNNING state."""
-        state_machine = RLGMStateMachine()
-        state_machine.transition(RLGMEvent.SEASON_START)
-        state_machine.transition(RLGMEvent.REGISTRATION_ACCEPTED)
-        state_machine.transition(RLGMEvent.ASSIGNMENT_RECEIVED)
-        handler = BroadcastCriticalResetHandler(state_machine)
-        return handler, state_machine
+_RUNNING, _INIT = RLGMState.RUNNING, RLGMState.INIT_START_STATE
 
-    def create_reset_message(self, reason="Season cancelled"):
-        """Create sample critical reset message."""
-        return {
-            "message_type": "BROADCAST_CRITICAL_RESET",
-            "broadcast_id": "CR001",
-            "payload": {
-                "reason": reason,
-                "timestamp": "2026-01-15T10:00:00Z",
-            },
-        }
+_RESET_MSG = MappingProxyType({
+    "message_type": "BROADCAST_CRITICAL_RESET",
+    "broadcast_id": "CR001",
+    "payload": MappingProxyType({
+        "reason": "Season cancelled",
+        "timestamp": "2026-01-15T10:00:00Z",
+    }),
+})
 
-    def test_resets_state_machine(self):
-        """Test that handler resets the state machine."""
-        handler, state_machine = self.create_handler_in_running_state()
-        assert state_machine.current_state == RLGMState.RUNNING
 
-        handler.handle(self.create_reset_message())
+def _reset_message(reason):
+    """Read-only copy of _RESET_MSG with only the reason replaced."""
+    payload = MappingProxyType({**_RESET_MSG["payload"], "reason": reason})
+    return MappingProxyType({**_RESET_MSG, "payload": payload})
 
-        assert state_machine.current_state == RLGMState.INIT_START_STATE
 
-    def test_clears_saved_state(self):
-        """Test that reset clears any saved state from pause."""
-        handler, state_machine = self.create_handler_in_running_state()
+@pytest.fixture
+def handler(running_sm):
+    """Handler bound to the per-test RUNNING state machine."""
+    return BroadcastCriticalResetHandler(running_sm)
 
-        # First pause to create saved state
-        state_machine.pause()
-        assert state_machine.saved_state is not None
 
-        # Then reset
-        handler.handle(self.create_reset_message())
-
-        assert state_machine.saved_state is None
-
-    def test_stores_reset_reason(self):
-        """Test that reset reason is stored."""
-        handler, _ = self.create_handler_in_running_state()
-
-        handler.handle(self.create_reset_message(reason="Technical issues"))
-
-        assert handler.reset_reason == "Technical issues"
+class TestBroadcastCriticalResetHandler:
+    """Tests for BroadcastCriticalResetHandler."""
 
-    def test_returns_none(self):
-        """Test that handler returns None (no response needed)."""
-        handler, _ = self.create_handler_in_running_state()
+    @pytest.mark.parametrize("message, reason", [
+        (_RESET_MSG, "Season cancelled"),
+        (_reset_message("Technical issues"), "Technical issues"),
+    ], ids=["default_reason", "custom_reason"])
+    def test_reset_behavior(self, handler, running_sm, message, reason):
+        """Reset returns to INIT, stores the reason and needs no response."""
+        assert running_sm.current_state is _RUNNING
 
-        result = handler.handle(self.create_reset_message())
+        result = handler.handle(message)
 
         assert result is None
+        assert running_sm.current_state is _INIT
+        assert handler.reset_reason == reason
 
-    def test_logs_reset(self):
-        """Test that reset is logged."""
-        handler, _ = self.create_handler_in_running_state()
+    def test_clears_saved_state(self, handler, running_sm):
+        """Test that reset clears any saved state from pause."""
+        # First pause to create saved state
+        running_sm.pause()
+        assert running_sm.saved_state is not None
+
+        # Then reset
+        handler.handle(_RESET_MSG)
 
-        with patch("q21_referee._rlgm.handler_critical_reset.logger") as mock_logger:
-            handler.handle(self.create_reset_message())
-            mock_logger.warning.assert_called()
+        assert running_sm.saved_state is None
 
     def test_reset_from_any_state(self):
         """Test that reset works from any state."""
@@ -84,10 +73,10 @@ class TestBroadcastCriticalResetHandler:
         handler = BroadcastCriticalResetHandler(state_machine)
 
         # From INIT
-        handler.handle(self.create_reset_message())
-        assert state_machine.current_state == RLGMState.INIT_START_STATE
+        handler.handle(_RESET_MSG)
+        assert state_machine.current_state is _INIT
 
         # From WAITING_FOR_CONFIRMATION
         state_machine.transition(RLGMEvent.SEASON_START)
-        handler.handle(self.create_reset_message())
-        assert state_machine.current_state == RLGMState.INIT_START_STATE
+        handler.handle(_RESET_MSG)
+        assert state_machine.current_state is _INIT
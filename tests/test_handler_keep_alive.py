@@ -2,39 +2,55 @@
 # PRD: docs/prd-rlgm.md
 """Tests for BROADCAST_KEEP_ALIVE handler."""
 
+from __future__ import annotations
+
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import patch
+
 from q21_referee._rlgm.handler_keep_alive import BroadcastKeepAliveHandler
 from q21_referee._rlgm.response_builder import RLGMResponseBuilder
 
+pytestmark = pytest.mark.rlgm_handlers
+
+
+_KEEP_ALIVE_MSG = MappingProxyType({
+    "message_type": "BROADCAST_KEEP_ALIVE",
+    "broadcast_id": "KA001",
+    "payload": MappingProxyType({
+        "timestamp": "2026-01-15T10:00:00Z",
+    }),
+})
+
+
+@pytest.fixture(scope="session")
+def ka_config():
+    """Keep-alive referee config; only read by the handler and builder."""
+    return {
+        "referee_id": "REF001",
+        "referee_email": "ref@test.com",
+        "group_id": "GROUP_A",
+    }
+
+
+@pytest.fixture(scope="session")
+def ka_response_builder(ka_config):
+    """Stateless response builder shared across the session."""
+    return RLGMResponseBuilder(ka_config)
+
+
+@pytest.fixture
+def handler(ka_config, ka_response_builder):
+    """Fresh handler per test; it tracks last_keep_alive."""
+    return BroadcastKeepAliveHandler(ka_config, ka_response_builder)
+
 
 class TestBroadcastKeepAliveHandler:
     """Tests for BroadcastKeepAliveHandler."""
 
-    def create_handler(self):
-        """Create handler with sample config."""
-        config = {
-            "referee_id": "REF001",
-            "referee_email": "ref@test.com",
-            "group_id": "GROUP_A",
-        }
-        response_builder = RLGMResponseBuilder(config)
-        return BroadcastKeepAliveHandler(config, response_builder)
-
-    def create_keep_alive_message(self):
-        """Create sample keep-alive message."""
-        return {
-            "message_type": "BROADCAST_KEEP_ALIVE",
-            "broadcast_id": "KA001",
-            "payload": {
-                "timestamp": "2026-01-15T10:00:00Z",
-            },
-        }
-
-    def test_responds_to_keep_alive(self):
+    def test_responds_to_keep_alive(self, handler):
         """Test that handler returns RESPONSE_KEEP_ALIVE."""
-        handler = self.create_handler()
-        message = self.create_keep_alive_message()
+        message = _KEEP_ALIVE_MSG
 
         result = handler.handle(message)
 
@@ -43,22 +59,12 @@ class TestBroadcastKeepAliveHandler:
         assert result["payload"]["status"] == "alive"
         assert result["payload"]["referee_id"] == "REF001"
 
-    def test_updates_last_seen_timestamp(self):
+    def test_updates_last_seen_timestamp(self, handler):
         """Test that handler updates last seen timestamp."""
-        handler = self.create_handler()
-        message = self.create_keep_alive_message()
+        message = _KEEP_ALIVE_MSG
 
         assert handler.last_keep_alive is None
 
         handler.handle(message)
 
         assert handler.last_keep_alive is not None
-
-    def test_logs_keep_alive(self):
-        """Test that keep-alive is logged."""
-        handler = self.create_handler()
-        message = self.create_keep_alive_message()
-
-        with patch("q21_referee._rlgm.handler_keep_alive.logger") as mock_logger:
-            handler.handle(message)
-            mock_logger.debug.assert_called()
@@ -2,31 +2,38 @@
 # PRD: docs/prd-rlgm.md
 """Tests for malfunction detection in BROADCAST_NEW_LEAGUE_ROUND handler."""
 
+from __future__ import annotations
+
+import sys
+
 import pytest
-from q21_referee._rlgm.handler_new_round import BroadcastNewRoundHandler
-from q21_referee._rlgm.state_machine import RLGMStateMachine
-from q21_referee._rlgm.enums import RLGMEvent
+
 from q21_referee._rlgm.gprm import GPRM
+from q21_referee._rlgm.handler_new_round import BroadcastNewRoundHandler
+
+pytestmark = pytest.mark.rlgm_handlers
 
 
-def _make_handler():
-    """Create handler with state machine in RUNNING state."""
-    sm = RLGMStateMachine()
-    sm.transition(RLGMEvent.SEASON_START)
-    sm.transition(RLGMEvent.REGISTRATION_ACCEPTED)
-    sm.transition(RLGMEvent.ASSIGNMENT_RECEIVED)
+P1 = sys.intern("p1@test.com")
+P2 = sys.intern("p2@test.com")
+OTHER = sys.intern("other@test.com")
+
+
+@pytest.fixture
+def handler(running_sm):
+    """Handler with one round assigned, on a RUNNING state machine."""
     config = {"season_id": "S01"}
     assignments = [
         {
             "round_number": 1,
             "game_id": "0101001",
             "player1_id": "P001",
-            "player1_email": "p1@test.com",
+            "player1_email": P1,
             "player2_id": "P002",
-            "player2_email": "p2@test.com",
+            "player2_email": P2,
         },
     ]
-    return BroadcastNewRoundHandler(sm, config, assignments)
+    return BroadcastNewRoundHandler(running_sm, config, assignments)
 
 
 def _make_message(lookup_table=None, include_key=True):
@@ -49,92 +56,55 @@ def _make_message(lookup_table=None, include_key=True):
 class TestNewRoundMalfunctionDetection:
     """Tests for malfunction detection wired into handler_new_round."""
 
-    def test_no_lookup_table_in_payload_returns_normal(self):
-        """When participant_lookup_table is absent, status is NORMAL."""
-        handler = _make_handler()
-        result = handler.handle(_make_message(include_key=False))
-
-        assert result is not None
-        assert result["malfunction"]["status"] == "NORMAL"
-
-    def test_lookup_table_none_returns_normal(self):
-        """When participant_lookup_table is explicitly None, status NORMAL."""
-        handler = _make_handler()
-        result = handler.handle(_make_message(lookup_table=None))
+    @pytest.mark.parametrize("table,include_key,status,missing", [
+        (None, False, "NORMAL", []),
+        (None, True, "NORMAL", []),
+        ([P1, P2, OTHER], True, "NORMAL", []),
+        ([P2, OTHER], True, "SINGLE_PLAYER", [P1]),
+        ([P1, OTHER], True, "SINGLE_PLAYER", [P2]),
+        ([OTHER], True, "CANCELLED", [P1, P2]),
+    ], ids=["no_key", "lookup_none", "both_present", "player1_missing",
+            "player2_missing", "both_missing"])
+    def test_malfunction_status(self, handler, table, include_key, status, missing):
+        """Lookup table contents classify the game and list missing players."""
+        result = handler.handle(_make_message(table, include_key))
 
         assert result is not None
-        assert result["malfunction"]["status"] == "NORMAL"
+        assert result.malfunction["status"] == status
+        assert result.malfunction["missing_players"] == missing
 
-    def test_both_players_in_lookup_table_returns_normal(self):
-        """Both players present in lookup table -> NORMAL."""
-        handler = _make_handler()
-        table = ["p1@test.com", "p2@test.com", "other@test.com"]
-        result = handler.handle(_make_message(lookup_table=table))
+    @pytest.mark.parametrize("table,role,email", [
+        ([P2], "player1", P1),
+        ([P1], "player2", P2),
+    ])
+    def test_single_player_reports_missing_role(self, handler, table, role, email):
+        """SINGLE_PLAYER names the absent player's role and email."""
+        mal = handler.handle(_make_message(lookup_table=table)).malfunction
 
-        assert result is not None
-        assert result["malfunction"]["status"] == "NORMAL"
-        assert result["malfunction"]["missing_players"] == []
-
-    def test_player1_missing_returns_single_player(self):
-        """Player1 not in lookup table -> SINGLE_PLAYER."""
-        handler = _make_handler()
-        table = ["p2@test.com", "other@test.com"]
-        result = handler.handle(_make_message(lookup_table=table))
-
-        assert result is not None
-        mal = result["malfunction"]
-        assert mal["status"] == "SINGLE_PLAYER"
-        assert mal["missing_player_role"] == "player1"
-        assert mal["missing_player_email"] == "p1@test.com"
-
-    def test_player2_missing_returns_single_player(self):
-        """Player2 not in lookup table -> SINGLE_PLAYER."""
-        handler = _make_handler()
-        table = ["p1@test.com", "other@test.com"]
-        result = handler.handle(_make_message(lookup_table=table))
-
-        assert result is not None
-        mal = result["malfunction"]
-        assert mal["status"] == "SINGLE_PLAYER"
-        assert mal["missing_player_role"] == "player2"
-        assert mal["missing_player_email"] == "p2@test.com"
-
-    def test_both_players_missing_returns_cancelled(self):
-        """Both players missing -> CANCELLED."""
-        handler = _make_handler()
-        table = ["other@test.com"]
-        result = handler.handle(_make_message(lookup_table=table))
-
-        assert result is not None
-        mal = result["malfunction"]
-        assert mal["status"] == "CANCELLED"
-        assert "p1@test.com" in mal["missing_players"]
-        assert "p2@test.com" in mal["missing_players"]
+        assert mal["missing_player_role"] == role
+        assert mal["missing_player_email"] == email
 
-    def test_gprm_still_built_when_cancelled(self):
+    def test_gprm_still_built_when_cancelled(self, handler):
         """GPRM is built even when both players are missing (CANCELLED)."""
-        handler = _make_handler()
-        table = ["other@test.com"]
+        table = [OTHER]
         result = handler.handle(_make_message(lookup_table=table))
 
         assert result is not None
-        assert isinstance(result["gprm"], GPRM)
-        assert result["gprm"].game_id == "0101001"
+        assert isinstance(result.gprm, GPRM)
+        assert result.gprm.game_id == "0101001"
 
-    def test_gprm_still_built_when_single_player(self):
+    def test_gprm_still_built_when_single_player(self, handler):
         """GPRM is built even in SINGLE_PLAYER mode."""
-        handler = _make_handler()
-        table = ["p2@test.com"]
+        table = [P2]
         result = handler.handle(_make_message(lookup_table=table))
 
         assert result is not None
-        assert isinstance(result["gprm"], GPRM)
+        assert isinstance(result.gprm, GPRM)
 
-    def test_case_insensitive_lookup(self):
+    def test_case_insensitive_lookup(self, handler):
         """Lookup table matching should be case-insensitive."""
-        handler = _make_handler()
         table = ["P1@TEST.COM", "P2@TEST.COM"]
         result = handler.handle(_make_message(lookup_table=table))
 
         assert result is not None
-        assert result["malfunction"]["status"] == "NORMAL"
+        assert result.malfunction["status"] == "NORMAL"
@@ -2,13 +2,18 @@
 # PRD: docs/prd-rlgm.md
 """Tests for SEASON_REGISTRATION_RESPONSE handler."""
 
+from __future__ import annotations
+
 import pytest
+
 from q21_referee._rlgm.handler_registration_response import (
     SeasonRegistrationResponseHandler,
 )
 from q21_referee._rlgm.state_machine import RLGMStateMachine
 from q21_referee._rlgm.enums import RLGMState, RLGMEvent
 
+pytestmark = pytest.mark.rlgm_handlers
+
 
 class TestSeasonRegistrationResponseHandler:
     """Tests for SeasonRegistrationResponseHandler."""
@@ -2,10 +2,17 @@
 # PRD: docs/prd-rlgm.md
 """Tests for BROADCAST_ROUND_RESULTS handler."""
 
+from __future__ import annotations
+
+from unittest.mock import Mock
+
 import pytest
-from unittest.mock import patch
+
+from q21_referee._rlgm import handler_round_results as _mod
 from q21_referee._rlgm.handler_round_results import BroadcastRoundResultsHandler
 
+pytestmark = pytest.mark.rlgm_handlers
+
 
 class TestBroadcastRoundResultsHandler:
     """Tests for BroadcastRoundResultsHandler."""
@@ -44,14 +51,16 @@ class TestBroadcastRoundResultsHandler:
             },
         }
 
-    def test_logs_round_results(self):
+    def test_logs_round_results(self, monkeypatch):
         """Test that round results are logged."""
         handler = self.create_handler()
         message = self.create_round_results_message()
+        mock_logger = Mock()
+        monkeypatch.setattr(_mod, "logger", mock_logger)
+
+        handler.handle(message)
 
-        with patch("q21_referee._rlgm.handler_round_results.logger") as mock_logger:
-            handler.handle(message)
-            mock_logger.info.assert_called()
+        mock_logger.info.assert_called()
 
     def test_stores_results_for_reference(self):
         """Test that results are stored for reference."""
@@ -101,5 +110,5 @@ class TestBroadcastRoundResultsHandler:
         handler.handle(message)
 
         assert handler.last_round_number == 2
-        assert handler.last_results == []
-        assert handler.last_standings == []
+        assert handler.last_results == ()
+        assert handler.last_standings == ()
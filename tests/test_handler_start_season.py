@@ -2,7 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for BROADCAST_START_SEASON handler."""
 
-import pytest
+from __future__ import annotations
+
 from q21_referee._rlgm.handler_start_season import BroadcastStartSeasonHandler
 from q21_referee._rlgm.state_machine import RLGMStateMachine
 from q21_referee._rlgm.enums import RLGMState, RLGMEvent
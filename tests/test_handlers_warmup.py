@@ -2,45 +2,60 @@
 # PRD: docs/prd-rlgm.md
 """Tests for warmup handler resilience."""
 
-from unittest.mock import Mock, patch
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from q21_referee._gmc.handlers import warmup as _warmup
 from q21_referee._gmc.handlers.warmup import handle_warmup_response
 from q21_referee._gmc.state import GamePhase
 
+# Stub-only collaborators: tests never assert on them, so no Mock tracking.
+_CONTEXT_BUILDER = SimpleNamespace(build_round_start_info_ctx=lambda *a, **k: {})
+_BUILDER = SimpleNamespace(build_round_start=lambda *a, **k: (
+    {"message_id": "msg1", "message_type": "Q21ROUNDSTART"}, "SUBJECT",
+))
+
+
+@pytest.fixture(scope="class")
+def ctx_template():
+    """Context Mocks shared by the tests of one class."""
+    return Mock(), Mock(), Mock()
+
+
+@pytest.fixture
+def ctx(ctx_template):
+    """Shared mock handler context, reset and reconfigured per test."""
+    ctx, player, other = ctx_template
+    for mock in (ctx, player, other):
+        mock.reset_mock(return_value=True, side_effect=True)
 
-def make_ctx(callback_raises=None):
-    """Build a mock handler context with both warmups already received."""
-    ctx = Mock()
     ctx.body = {"payload": {"answer": "4"}}
     ctx.sender_email = "p1@test.com"
 
-    player = Mock()
     player.participant_id = "P001"
     player.warmup_answer = None
     ctx.state.get_player_by_email.return_value = player
     ctx.state.both_warmups_received.return_value = True
     ctx.state.player1 = player
-    ctx.state.player2 = Mock(
-        participant_id="P002", email="p2@test.com",
-        questions_message_id=None,
-    )
+    other.participant_id = "P002"
+    other.email = "p2@test.com"
+    other.questions_message_id = None
+    ctx.state.player2 = other
     ctx.state.active_players.return_value = [
         ctx.state.player1, ctx.state.player2,
     ]
 
-    ctx.context_builder.build_round_start_info_ctx.return_value = {}
+    ctx.context_builder, ctx.builder = _CONTEXT_BUILDER, _BUILDER
 
-    if callback_raises:
-        ctx.ai.get_round_start_info.side_effect = callback_raises
-    else:
-        ctx.ai.get_round_start_info.return_value = {
-            "book_name": "Test", "book_hint": "Hint",
-            "association_word": "word",
-        }
+    ctx.ai.get_round_start_info.return_value = {
+        "book_name": "Test", "book_hint": "Hint",
+        "association_word": "word",
+    }
 
-    ctx.builder.build_round_start.return_value = (
-        {"message_id": "msg1", "message_type": "Q21ROUNDSTART"},
-        "SUBJECT",
-    )
     ctx.state.game_id = "0101001"
     ctx.state.match_id = "0101001"
     ctx.state.auth_token = "tok_abc"
@@ -52,50 +67,42 @@ def make_ctx(callback_raises=None):
 class TestWarmupHandlerResilience:
     """Tests for warmup handler callback failure."""
 
-    @patch(
-        "q21_referee._gmc.handlers.warmup.execute_callback",
-        side_effect=ValueError("AI broke"),
-    )
-    def test_callback_failure_returns_empty(self, mock_exec):
+    def test_callback_failure_returns_empty(self, ctx, monkeypatch):
         """If execute_callback raises, handler returns empty list."""
-        ctx = make_ctx(callback_raises=ValueError("AI broke"))
+        monkeypatch.setattr(_warmup, "execute_callback",
+                            Mock(side_effect=ValueError("AI broke")))
+        ctx.ai.get_round_start_info.side_effect = ValueError("AI broke")
         outgoing = handle_warmup_response(ctx)
         assert outgoing == []
 
-    @patch("q21_referee._gmc.handlers.warmup.execute_callback")
-    def test_successful_callback_sends_round_start(self, mock_exec):
+    def test_successful_callback_sends_round_start(self, ctx, monkeypatch):
         """Normal flow: both players get Q21ROUNDSTART."""
-        mock_exec.return_value = {
+        monkeypatch.setattr(_warmup, "execute_callback", Mock(return_value={
             "book_name": "Test", "book_hint": "Hint",
             "association_word": "word",
-        }
-        ctx = make_ctx()
+        }))
         outgoing = handle_warmup_response(ctx)
         assert len(outgoing) == 2
 
-    def test_unknown_player_returns_empty(self):
+    def test_unknown_player_returns_empty(self, ctx):
         """Unknown sender returns empty list."""
-        ctx = make_ctx()
         ctx.state.get_player_by_email.return_value = None
         outgoing = handle_warmup_response(ctx)
         assert outgoing == []
 
-    @patch("q21_referee._gmc.handlers.warmup.execute_callback")
-    def test_waiting_for_other_player(self, mock_exec):
+    def test_waiting_for_other_player(self, ctx, monkeypatch):
         """Only one warmup received: returns empty, no callback."""
-        ctx = make_ctx()
+        mock_exec = Mock()
+        monkeypatch.setattr(_warmup, "execute_callback", mock_exec)
         ctx.state.both_warmups_received.return_value = False
         outgoing = handle_warmup_response(ctx)
         assert outgoing == []
         mock_exec.assert_not_called()
 
-    @patch(
-        "q21_referee._gmc.handlers.warmup.execute_callback",
-        side_effect=TimeoutError("deadline exceeded"),
-    )
-    def test_timeout_error_returns_empty(self, mock_exec):
+    def test_timeout_error_returns_empty(self, ctx, monkeypatch):
         """Timeout in callback also returns empty list."""
-        ctx = make_ctx()
+        monkeypatch.setattr(_warmup, "execute_callback",
+                            Mock(side_effect=TimeoutError("deadline exceeded")))
         outgoing = handle_warmup_response(ctx)
         assert outgoing == []
 
@@ -103,29 +110,25 @@ class TestWarmupHandlerResilience:
 class TestWarmupDuplicateAndPhaseGuards:
     """Tests for duplicate protection and phase guards."""
 
-    def test_duplicate_warmup_returns_empty(self):
+    def test_duplicate_warmup_returns_empty(self, ctx):
         """Second warmup from same player is silently rejected."""
-        ctx = make_ctx()
         player = ctx.state.get_player_by_email.return_value
         player.warmup_answer = "already answered"
         outgoing = handle_warmup_response(ctx)
         assert outgoing == []
 
-    def test_wrong_phase_returns_empty(self):
+    def test_wrong_phase_returns_empty(self, ctx):
         """Warmup response in wrong phase is rejected."""
-        ctx = make_ctx()
         ctx.state.phase = GamePhase.ROUND_STARTED
         outgoing = handle_warmup_response(ctx)
         assert outgoing == []
 
-    @patch("q21_referee._gmc.handlers.warmup.execute_callback")
-    def test_correct_phase_processes(self, mock_exec):
+    def test_correct_phase_processes(self, ctx, monkeypatch):
         """Warmup response in WARMUP_SENT phase is accepted."""
-        mock_exec.return_value = {
+        monkeypatch.setattr(_warmup, "execute_callback", Mock(return_value={
             "book_name": "Test", "book_hint": "Hint",
             "association_word": "word",
-        }
-        ctx = make_ctx()
+        }))
         ctx.state.phase = GamePhase.WARMUP_SENT
         outgoing = handle_warmup_response(ctx)
         assert len(outgoing) == 2
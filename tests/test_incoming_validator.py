@@ -2,51 +2,78 @@
 # PRD: docs/prd-rlgm.md
 """Tests for q21_referee._gmc.incoming_validator — player message validation."""
 
+from __future__ import annotations
+
+import copy
+from types import MappingProxyType
+
 from q21_referee._gmc.incoming_validator import validate_player_message
 
 
 # ── Helpers ──────────────────────────────────────────────────
 
 
+_WARMUP = {
+    "message_type": "Q21_WARMUP_RESPONSE",
+    "sender": {"email": "p1@test.com"},
+    "payload": {"answer": "4"},
+}
+
+_QUESTIONS = {
+    "message_type": "Q21_QUESTIONS_BATCH",
+    "sender": {"email": "p1@test.com"},
+    "payload": {"questions": [{"q": "What?"}]},
+}
+
+_GUESS = {
+    "message_type": "Q21_GUESS_SUBMISSION",
+    "sender": {"email": "p1@test.com"},
+    "payload": {"opening_sentence": "It was...", "associative_word": "cat"},
+}
+
+_UNKNOWN = {
+    "message_type": "SOME_UNKNOWN_TYPE",
+    "sender": {"email": "p1@test.com"},
+    "payload": {"anything": "goes"},
+}
+
+
+# Read-only tests validate these views; the validator requires nested
+# sender/payload to be real dicts, so only the top level is proxied.
+_WARMUP_VIEW = MappingProxyType(_WARMUP)
+_QUESTIONS_VIEW = MappingProxyType(_QUESTIONS)
+_GUESS_VIEW = MappingProxyType(_GUESS)
+_UNKNOWN_VIEW = MappingProxyType(_UNKNOWN)
+
+
+# Deep copies for tests that mutate the message.
 def _valid_warmup() -> dict:
-    return {
-        "message_type": "Q21_WARMUP_RESPONSE",
-        "sender": {"email": "p1@test.com"},
-        "payload": {"answer": "4"},
-    }
+    return copy.deepcopy(_WARMUP)
 
 
 def _valid_questions() -> dict:
-    return {
-        "message_type": "Q21_QUESTIONS_BATCH",
-        "sender": {"email": "p1@test.com"},
-        "payload": {"questions": [{"q": "What?"}]},
-    }
+    return copy.deepcopy(_QUESTIONS)
 
 
 def _valid_guess() -> dict:
-    return {
-        "message_type": "Q21_GUESS_SUBMISSION",
-        "sender": {"email": "p1@test.com"},
-        "payload": {"opening_sentence": "It was...", "associative_word": "cat"},
-    }
+    return copy.deepcopy(_GUESS)
 
 
 # ── Valid messages ───────────────────────────────────────────
 
 
 def test_valid_warmup_response():
-    errors = validate_player_message(_valid_warmup())
+    errors = validate_player_message(_WARMUP_VIEW)
     assert errors == []
 
 
 def test_valid_questions_batch():
-    errors = validate_player_message(_valid_questions())
+    errors = validate_player_message(_QUESTIONS_VIEW)
     assert errors == []
 
 
 def test_valid_guess_submission():
-    errors = validate_player_message(_valid_guess())
+    errors = validate_player_message(_GUESS_VIEW)
     assert errors == []
 
 
@@ -131,10 +158,16 @@ def test_sender_missing_email():
 
 
 def test_unknown_message_type_passes():
-    msg = {
-        "message_type": "SOME_UNKNOWN_TYPE",
-        "sender": {"email": "p1@test.com"},
-        "payload": {"anything": "goes"},
-    }
-    errors = validate_player_message(msg)
+    errors = validate_player_message(_UNKNOWN_VIEW)
     assert errors == []
+
+
+# ── Shared templates ─────────────────────────────────────────
+
+
+def test_validator_does_not_mutate_templates():
+    templates = (_WARMUP, _QUESTIONS, _GUESS, _UNKNOWN)
+    snapshot = copy.deepcopy(templates)
+    for msg in templates:
+        validate_player_message(msg)
+    assert templates == snapshot
@@ -2,49 +2,41 @@
 # PRD: docs/prd-rlgm.md
 """Tests for malfunction detection from participant lookup table."""
 
-import pytest
-from q21_referee._rlgm.malfunction_detector import detect_malfunctions
+from __future__ import annotations
 
+import pytest
 
-class TestDetectMalfunctionsNormal:
-    def test_both_players_present(self):
-        lookup = ["p1@test.com", "p2@test.com", "ref@test.com"]
-        result = detect_malfunctions(lookup, "p1@test.com", "p2@test.com")
-        assert result["status"] == "NORMAL"
-        assert result["missing_players"] == []
-
-    def test_extra_participants_ignored(self):
-        lookup = ["other@test.com", "p1@test.com", "p2@test.com"]
-        result = detect_malfunctions(lookup, "p1@test.com", "p2@test.com")
-        assert result["status"] == "NORMAL"
+from q21_referee._rlgm.malfunction_detector import detect_malfunctions
 
 
-class TestDetectMalfunctionsSinglePlayer:
-    def test_player1_missing(self):
-        lookup = ["p2@test.com", "ref@test.com"]
-        result = detect_malfunctions(lookup, "p1@test.com", "p2@test.com")
-        assert result["status"] == "SINGLE_PLAYER"
-        assert result["missing_player_role"] == "player1"
-        assert result["missing_player_email"] == "p1@test.com"
+P1, P2, REF = "p1@test.com", "p2@test.com", "ref@test.com"
 
-    def test_player2_missing(self):
-        lookup = ["p1@test.com", "ref@test.com"]
-        result = detect_malfunctions(lookup, "p1@test.com", "p2@test.com")
-        assert result["status"] == "SINGLE_PLAYER"
-        assert result["missing_player_role"] == "player2"
-        assert result["missing_player_email"] == "p2@test.com"
 
+class TestDetectMalfunctions:
+    """Status and missing players for each lookup table shape."""
 
-class TestDetectMalfunctionsCancelled:
-    def test_both_players_missing(self):
-        lookup = ["ref@test.com"]
-        result = detect_malfunctions(lookup, "p1@test.com", "p2@test.com")
-        assert result["status"] == "CANCELLED"
-        assert len(result["missing_players"]) == 2
+    @pytest.mark.parametrize("lookup,expected_status,expected_missing", [
+        ((P1, P2, REF), "NORMAL", []),
+        (("other@test.com", P1, P2), "NORMAL", []),
+        ((P2, REF), "SINGLE_PLAYER", [P1]),
+        ((P1, REF), "SINGLE_PLAYER", [P2]),
+        ((REF,), "CANCELLED", [P1, P2]),
+        ((), "CANCELLED", [P1, P2]),
+    ], ids=["both_present", "extra_ignored", "player1_missing",
+            "player2_missing", "both_missing", "empty_lookup"])
+    def test_status(self, lookup, expected_status, expected_missing):
+        result = detect_malfunctions(lookup, P1, P2)
+        assert result["status"] == expected_status
+        assert result["missing_players"] == expected_missing
 
-    def test_empty_lookup_table(self):
-        result = detect_malfunctions([], "p1@test.com", "p2@test.com")
-        assert result["status"] == "CANCELLED"
+    @pytest.mark.parametrize("lookup,role,email", [
+        ((P2, REF), "player1", P1),
+        ((P1, REF), "player2", P2),
+    ])
+    def test_single_player_reports_missing_role(self, lookup, role, email):
+        result = detect_malfunctions(lookup, P1, P2)
+        assert result["missing_player_role"] == role
+        assert result["missing_player_email"] == email
 
 
 class TestDetectMalfunctionsEdgeCases:
@@ -52,6 +44,11 @@ class TestDetectMalfunctionsEdgeCases:
         result = detect_malfunctions(None, "p1@test.com", "p2@test.com")
         assert result["status"] == "NORMAL"
 
+    def test_normal_result_is_a_fresh_dict(self):
+        first = detect_malfunctions(None, P1, P2)
+        first["missing_players"].append(P1)
+        assert detect_malfunctions(None, P1, P2)["missing_players"] == []
+
     def test_case_insensitive_emails(self):
         lookup = ["P1@TEST.COM", "p2@test.com"]
         result = detect_malfunctions(lookup, "p1@test.com", "P2@Test.Com")
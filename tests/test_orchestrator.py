@@ -2,35 +2,22 @@
 # PRD: docs/prd-rlgm.md
 """Tests for RLGM Orchestrator."""
 
-import pytest
+from __future__ import annotations
+
 from unittest.mock import Mock, MagicMock
+
+import pytest
+
 from q21_referee._rlgm.orchestrator import RLGMOrchestrator
-from q21_referee._rlgm.gprm import GPRM
 from q21_referee._rlgm.enums import RLGMState, RLGMEvent
-from q21_referee.callbacks import RefereeAI
 from q21_referee._gmc.gmc import GameManagementCycle
 
 
-class MockRefereeAI(RefereeAI):
-    """Mock AI for testing."""
-
-    def get_warmup_question(self, ctx):
-        return {"warmup_question": "What is 2+2?"}
-
-    def get_round_start_info(self, ctx):
-        return {"book_name": "Test", "book_hint": "A test", "association_word": "test"}
-
-    def get_answers(self, ctx):
-        return {"answers": ["A", "B", "C"]}
-
-    def get_score_feedback(self, ctx):
-        return {"league_points": 10, "private_score": 5.0, "breakdown": {}}
-
-
 class TestRLGMOrchestrator:
     """Tests for RLGMOrchestrator class."""
 
-    def create_config(self):
+    @staticmethod
+    def create_config():
         """Create sample config."""
         return {
             "referee_id": "REF001",
@@ -42,21 +29,25 @@ class TestRLGMOrchestrator:
             "league_manager_email": "lm@test.com",
         }
 
-    def test_initial_state(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def orch(cls, mock_ai):
+        """One orchestrator shared by the read-only registration tests."""
+        return RLGMOrchestrator(config=cls.create_config(), ai=mock_ai)
+
+    def test_initial_state(self, mock_ai):
         """Test orchestrator starts in INIT state."""
         config = self.create_config()
-        ai = MockRefereeAI()
 
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
+        orchestrator = RLGMOrchestrator(config=config, ai=mock_ai)
 
         assert orchestrator.state_machine.current_state == RLGMState.INIT_START_STATE
         assert orchestrator.current_game is None
 
-    def test_handle_start_season(self):
+    def test_handle_start_season(self, mock_ai):
         """Test handling BROADCAST_START_SEASON message."""
         config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
+        orchestrator = RLGMOrchestrator(config=config, ai=mock_ai)
 
         message = {
             "message_type": "BROADCAST_START_SEASON",
@@ -71,19 +62,14 @@ class TestRLGMOrchestrator:
         assert result["message_type"] == "SEASON_REGISTRATION_REQUEST"
 
 
-    def test_route_player_message_no_handler(self):
+    def test_route_player_message_no_handler(self, mock_ai, gprm_factory):
         """Test routing player message with no matching handler returns empty."""
         config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
-
-        gprm = GPRM(
-            player1_email="p1@test.com", player1_id="P001",
-            player2_email="p2@test.com", player2_id="P002",
-            season_id="SEASON_2026_Q1", game_id="0101001",
-            match_id="R1M1", round_id="ROUND_1", round_number=1,
-        )
-        orchestrator.current_game = GameManagementCycle(gprm=gprm, ai=ai, config=config)
+        orchestrator = RLGMOrchestrator(config=config, ai=mock_ai)
+
+        gprm = gprm_factory(season_id="SEASON_2026_Q1", match_id="R1M1",
+                            round_id="ROUND_1")
+        orchestrator.current_game = GameManagementCycle(gprm=gprm, ai=mock_ai, config=config)
 
         body = {
             "message_type": "UNKNOWN_TYPE",
@@ -95,11 +81,10 @@ class TestRLGMOrchestrator:
         )
         assert outgoing == []
 
-    def test_no_game_returns_empty(self):
+    def test_no_game_returns_empty(self, mock_ai):
         """Test routing when no game is active returns empty."""
         config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
+        orchestrator = RLGMOrchestrator(config=config, ai=mock_ai)
 
         outgoing = orchestrator.route_player_message(
             "Q21WARMUPRESPONSE", {}, "p1@test.com"
@@ -107,11 +92,10 @@ class TestRLGMOrchestrator:
 
         assert outgoing == []
 
-    def test_handle_new_round_uses_start_round(self):
+    def test_handle_new_round_uses_start_round(self, mock_ai):
         """Test that handle_lm_message for new round calls start_round."""
         config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
+        orchestrator = RLGMOrchestrator(config=config, ai=mock_ai)
 
         # Set up assignments
         orchestrator._assignments = [{
@@ -142,56 +126,35 @@ class TestRLGMOrchestrator:
         pending = orchestrator.get_pending_outgoing()
         assert len(pending) == 2  # warmup calls
 
-    def test_keep_alive_handler_registered(self):
+    def test_keep_alive_handler_registered(self, orch):
         """Issue #2: BroadcastKeepAliveHandler must be registered."""
-        config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
-
-        handler = orchestrator.router.get_handler("BROADCAST_KEEP_ALIVE")
+        handler = orch.router.get_handler("BROADCAST_KEEP_ALIVE")
         assert handler is not None
 
-    def test_critical_pause_handler_registered(self):
+    def test_critical_pause_handler_registered(self, orch):
         """Issue #3: BroadcastCriticalPauseHandler must be registered."""
-        config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
-
-        handler = orchestrator.router.get_handler("BROADCAST_CRITICAL_PAUSE")
+        handler = orch.router.get_handler("BROADCAST_CRITICAL_PAUSE")
         assert handler is not None
 
-    def test_critical_reset_handler_registered(self):
+    def test_critical_reset_handler_registered(self, orch):
         """Issue #3: BroadcastCriticalResetHandler must be registered."""
-        config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
-
-        handler = orchestrator.router.get_handler("BROADCAST_CRITICAL_RESET")
+        handler = orch.router.get_handler("BROADCAST_CRITICAL_RESET")
         assert handler is not None
 
-    def test_round_results_handler_registered(self):
+    def test_round_results_handler_registered(self, orch):
         """Issue #4: BroadcastRoundResultsHandler must be registered."""
-        config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
-
-        handler = orchestrator.router.get_handler("BROADCAST_ROUND_RESULTS")
+        handler = orch.router.get_handler("BROADCAST_ROUND_RESULTS")
         assert handler is not None
 
-    def test_league_completed_handler_registered(self):
+    def test_league_completed_handler_registered(self, orch):
         """Issue #5: LEAGUE_COMPLETED must have a handler."""
-        config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
-
-        handler = orchestrator.router.get_handler("LEAGUE_COMPLETED")
+        handler = orch.router.get_handler("LEAGUE_COMPLETED")
         assert handler is not None
 
-    def test_league_completed_transitions_state(self):
+    def test_league_completed_transitions_state(self, mock_ai):
         """LEAGUE_COMPLETED must transition state machine to COMPLETED."""
         config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
+        orchestrator = RLGMOrchestrator(config=config, ai=mock_ai)
 
         message = {
             "message_type": "LEAGUE_COMPLETED",
@@ -203,19 +166,14 @@ class TestRLGMOrchestrator:
 
         assert orchestrator.state_machine.current_state == RLGMState.COMPLETED
 
-    def test_league_completed_aborts_current_game(self):
+    def test_league_completed_aborts_current_game(self, mock_ai, gprm_factory):
         """LEAGUE_COMPLETED must abort any active game."""
         config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
-
-        gprm = GPRM(
-            player1_email="p1@test.com", player1_id="P001",
-            player2_email="p2@test.com", player2_id="P002",
-            season_id="S01", game_id="0101001",
-            match_id="R1M1", round_id="ROUND_1", round_number=1,
-        )
-        orchestrator.current_game = GameManagementCycle(gprm=gprm, ai=ai, config=config)
+        orchestrator = RLGMOrchestrator(config=config, ai=mock_ai)
+
+        gprm = gprm_factory(season_id="S01", match_id="R1M1",
+                            round_id="ROUND_1")
+        orchestrator.current_game = GameManagementCycle(gprm=gprm, ai=mock_ai, config=config)
         assert orchestrator.current_game is not None
 
         message = {
@@ -228,20 +186,15 @@ class TestRLGMOrchestrator:
 
         assert orchestrator.current_game is None
 
-    def test_game_id_mismatch_rejected(self):
+    def test_game_id_mismatch_rejected(self, mock_ai, gprm_factory):
         """Player message with wrong game_id is rejected."""
         config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
-
-        gprm = GPRM(
-            player1_email="p1@test.com", player1_id="P001",
-            player2_email="p2@test.com", player2_id="P002",
-            season_id="S01", game_id="0101001",
-            match_id="R1M1", round_id="ROUND_1", round_number=1,
-        )
+        orchestrator = RLGMOrchestrator(config=config, ai=mock_ai)
+
+        gprm = gprm_factory(season_id="S01", match_id="R1M1",
+                            round_id="ROUND_1")
         orchestrator.current_game = GameManagementCycle(
-            gprm=gprm, ai=ai, config=config)
+            gprm=gprm, ai=mock_ai, config=config)
 
         body = {
             "message_type": "Q21WARMUPRESPONSE",
@@ -253,20 +206,15 @@ class TestRLGMOrchestrator:
             "Q21WARMUPRESPONSE", body, "p1@test.com")
         assert outgoing == []
 
-    def test_matching_game_id_accepted(self):
+    def test_matching_game_id_accepted(self, mock_ai, gprm_factory):
         """Player message with correct game_id is processed."""
         config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
-
-        gprm = GPRM(
-            player1_email="p1@test.com", player1_id="P001",
-            player2_email="p2@test.com", player2_id="P002",
-            season_id="S01", game_id="0101001",
-            match_id="R1M1", round_id="ROUND_1", round_number=1,
-        )
+        orchestrator = RLGMOrchestrator(config=config, ai=mock_ai)
+
+        gprm = gprm_factory(season_id="S01", match_id="R1M1",
+                            round_id="ROUND_1")
         orchestrator.current_game = GameManagementCycle(
-            gprm=gprm, ai=ai, config=config)
+            gprm=gprm, ai=mock_ai, config=config)
 
         body = {
             "message_type": "Q21WARMUPRESPONSE",
@@ -278,11 +226,10 @@ class TestRLGMOrchestrator:
             "Q21WARMUPRESPONSE", body, "p1@test.com")
         assert isinstance(outgoing, list)
 
-    def test_duplicate_broadcast_skipped(self):
+    def test_duplicate_broadcast_skipped(self, mock_ai):
         """Duplicate broadcast_id is silently skipped."""
         config = self.create_config()
-        ai = MockRefereeAI()
-        orchestrator = RLGMOrchestrator(config=config, ai=ai)
+        orchestrator = RLGMOrchestrator(config=config, ai=mock_ai)
 
         message = {
             "message_type": "BROADCAST_START_SEASON",
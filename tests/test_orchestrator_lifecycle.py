@@ -2,38 +2,64 @@
 # PRD: docs/prd-rlgm.md
 """Tests for orchestrator round lifecycle: start_round, abort, complete."""
 
-import pytest
+from __future__ import annotations
+
 import logging
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock
+
+import pytest
+
+from q21_referee._rlgm import orchestrator as orchestrator_module
 from q21_referee._rlgm.orchestrator import RLGMOrchestrator
-from q21_referee._rlgm.gprm import GPRM
+from q21_referee._rlgm.state_machine import RLGMStateMachine
 from q21_referee._rlgm.enums import RLGMState, RLGMEvent
-from q21_referee._gmc.state import GamePhase
+from q21_referee._gmc.state import GamePhase, PlayerState
 from q21_referee.callbacks import RefereeAI
 
+pytestmark = pytest.mark.rlgm_orchestrator
+
+# Message types the outgoing-filter assertions look up.
+WARMUP_CALL = sys.intern("Q21WARMUPCALL")
+MATCH_REPORT = sys.intern("MATCH_RESULT_REPORT")
+SCORE_FEEDBACK = sys.intern("Q21SCOREFEEDBACK")
+
+
+# Callback results are built once; handlers only read them, and the
+# validators require plain dicts, so they are shared rather than proxied.
+_FEEDBACK_WORDS = " ".join(["word"] * 160)
+_WARMUP = {"warmup_question": "What is 2+2?"}
+_ROUND_START = {"book_name": "Test", "book_hint": "A test",
+                "association_word": "test"}
+_ANSWERS = {"answers": ["A", "B", "C"]}
+_SCORE_FB = {
+    "league_points": 2, "private_score": 50.0,
+    "breakdown": {
+        "opening_sentence_score": 20.0,
+        "sentence_justification_score": 10.0,
+        "associative_word_score": 15.0,
+        "word_justification_score": 5.0,
+    },
+    "feedback": {
+        "opening_sentence": _FEEDBACK_WORDS,
+        "associative_word": _FEEDBACK_WORDS,
+    },
+}
+
 
 class MockRefereeAI(RefereeAI):
     """Mock AI for testing."""
     def get_warmup_question(self, ctx):
-        return {"warmup_question": "What is 2+2?"}
+        return _WARMUP
     def get_round_start_info(self, ctx):
-        return {"book_name": "Test", "book_hint": "A test", "association_word": "test"}
+        return _ROUND_START
     def get_answers(self, ctx):
-        return {"answers": ["A", "B", "C"]}
+        return _ANSWERS
     def get_score_feedback(self, ctx):
-        return {
-            "league_points": 2, "private_score": 50.0,
-            "breakdown": {
-                "opening_sentence_score": 20.0,
-                "sentence_justification_score": 10.0,
-                "associative_word_score": 15.0,
-                "word_justification_score": 5.0,
-            },
-            "feedback": {
-                "opening_sentence": " ".join(["word"] * 160),
-                "associative_word": " ".join(["word"] * 160),
-            },
-        }
+        return _SCORE_FB
 
 
 def make_config():
@@ -44,42 +70,92 @@ def make_config():
     }
 
 
-def make_gprm(round_number=1):
-    return GPRM(
-        player1_email="p1@test.com", player1_id="P001",
-        player2_email="p2@test.com", player2_id="P002",
-        season_id="S01", game_id=f"01{round_number:02d}001",
-        match_id=f"01{round_number:02d}001", round_id=f"ROUND_{round_number}",
-        round_number=round_number,
-    )
+# No test here starts a season, so nothing writes to config; share both.
+_CONFIG = MappingProxyType(make_config())
+_AI = MockRefereeAI()
+
+
+@pytest.fixture(scope="module")
+def make_gprm(gprm_factory):
+    """GPRM for a round; frozen, so one instance per round is shared."""
+    @lru_cache(maxsize=8)
+    def make(round_number=1):
+        game_id = f"01{round_number:02d}001"
+        return gprm_factory(game_id=game_id, match_id=game_id,
+                            round_id=f"ROUND_{round_number}",
+                            round_number=round_number)
+    return make
+
+
+# Snapshot of a game aborted in WARMUP_SENT, for stubbed games.
+_SNAPSHOT = {
+    "game_id": "0101001", "phase": "warmup_sent",
+    "player1": {
+        "email": "p1@test.com", "participant_id": "P001",
+        "phase_reached": "warmup_sent", "scored": False,
+        "last_actor": "referee",
+    },
+    "player2": {
+        "email": "p2@test.com", "participant_id": "P002",
+        "phase_reached": "warmup_sent", "scored": False,
+        "last_actor": "referee",
+    },
+}
+
+
+def by_type(outgoing):
+    """Group (env, subject, recipient) tuples by message_type in one pass."""
+    grouped = defaultdict(list)
+    for e, s, r in outgoing:
+        grouped[e.get("message_type")].append((e, s, r))
+    return grouped
+
+
+@pytest.fixture
+def make_orchestrator():
+    """Factory for fresh orchestrators on the shared config and AI."""
+    return lambda: RLGMOrchestrator(config=_CONFIG, ai=_AI)
+
+
+@pytest.fixture
+def in_game_orchestrator(make_orchestrator, monkeypatch):
+    """Fresh orchestrator whose handlers share a from_state(IN_GAME) machine."""
+    sm = RLGMStateMachine.from_state(RLGMState.IN_GAME)
+    with monkeypatch.context() as m:
+        m.setattr(orchestrator_module, "RLGMStateMachine", lambda: sm)
+        return make_orchestrator()
 
 
 class TestStartRound:
     """Tests for orchestrator.start_round()."""
 
-    def test_start_round_creates_gmc_and_warmup(self):
+    @pytest.fixture(autouse=True)
+    def _orchestrator_info_logs(self, caplog):
+        """Capture INFO from the orchestrator logger only."""
+        caplog.set_level(logging.INFO, logger="q21_referee.rlgm.orchestrator")
+
+    def test_start_round_creates_gmc_and_warmup(self, make_orchestrator, make_gprm):
         """Test that start_round creates GMC and returns warmup messages."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
 
         outgoing = orchestrator.start_round(make_gprm(1))
 
         assert orchestrator.current_game is not None
         assert orchestrator.current_round_number == 1
         assert len(outgoing) == 2  # warmup calls for 2 players
-        for env, subject, recipient in outgoing:
-            assert env["message_type"] == "Q21WARMUPCALL"
+        assert {env["message_type"] for env, _, _ in outgoing} == {WARMUP_CALL}
 
-    def test_start_round_advances_gmc_phase(self):
+    def test_start_round_advances_gmc_phase(self, make_orchestrator, make_gprm):
         """Test that start_round sets GMC phase to WARMUP_SENT."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
 
         orchestrator.start_round(make_gprm(1))
 
         assert orchestrator.current_game.state.phase == GamePhase.WARMUP_SENT
 
-    def test_start_round_idempotent_same_round(self):
+    def test_start_round_idempotent_same_round(self, make_orchestrator, make_gprm):
         """Test that starting the same round twice is idempotent."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
 
         outgoing1 = orchestrator.start_round(make_gprm(1))
         first_game = orchestrator.current_game
@@ -89,53 +165,47 @@ class TestStartRound:
         assert orchestrator.current_game is first_game
         assert outgoing2 == []
 
-    def test_start_round_warmup_messages_target_players(self):
+    def test_start_round_warmup_messages_target_players(self, make_orchestrator, make_gprm):
         """Test that warmup messages are addressed to both players."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
 
         outgoing = orchestrator.start_round(make_gprm(1))
 
         recipients = {recipient for _, _, recipient in outgoing}
         assert recipients == {"p1@test.com", "p2@test.com"}
 
-    def test_start_round_aborts_previous_game(self, caplog):
+    def test_start_round_aborts_previous_game(self, make_orchestrator, caplog, make_gprm):
         """Test that starting a new round aborts the previous game."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
 
         orchestrator.start_round(make_gprm(1))
         first_game = orchestrator.current_game
 
-        with caplog.at_level(logging.INFO):
-            outgoing = orchestrator.start_round(make_gprm(2))
+        outgoing = orchestrator.start_round(make_gprm(2))
 
         assert orchestrator.current_game is not first_game
         assert orchestrator.current_round_number == 2
         # Should have abort report + 2 warmup calls
-        warmup_msgs = [
-            (e, s, r) for e, s, r in outgoing
-            if e.get("message_type") == "Q21WARMUPCALL"
-        ]
-        abort_msgs = [
-            (e, s, r) for e, s, r in outgoing
-            if e.get("message_type") == "MATCH_RESULT_REPORT"
-        ]
+        grouped = by_type(outgoing)
+        warmup_msgs = grouped[WARMUP_CALL]
+        abort_msgs = grouped[MATCH_REPORT]
         assert len(warmup_msgs) == 2
         assert len(abort_msgs) == 1
-        assert any("Aborting" in r.message for r in caplog.records)
+        assert any("Aborting" in m for m in caplog.messages)
 
 
 class TestAbortCurrentGame:
     """Tests for orchestrator.abort_current_game()."""
 
-    def test_abort_no_game_returns_empty(self):
+    def test_abort_no_game_returns_empty(self, make_orchestrator):
         """Test that aborting when no game is active returns empty."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
         outgoing = orchestrator.abort_current_game("new_round_started")
         assert outgoing == []
 
-    def test_abort_during_warmup_sent(self):
+    def test_abort_during_warmup_sent(self, make_orchestrator, make_gprm):
         """Test aborting during WARMUP_SENT phase (no player responded)."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
         orchestrator.start_round(make_gprm(1))
         assert orchestrator.current_game.state.phase == GamePhase.WARMUP_SENT
 
@@ -143,19 +213,16 @@ class TestAbortCurrentGame:
 
         # Should produce MATCH_RESULT_REPORT only (no players to score)
         assert orchestrator.current_game is None
-        match_reports = [
-            (e, s, r) for e, s, r in outgoing
-            if e.get("message_type") == "MATCH_RESULT_REPORT"
-        ]
+        match_reports = by_type(outgoing)[MATCH_REPORT]
         assert len(match_reports) == 1
         env = match_reports[0][0]
         assert env["payload"]["status"] == "aborted"
         assert env["payload"]["abort_reason"] == "new_round_started"
         assert "player_states" in env["payload"]
 
-    def test_abort_during_guesses_scores_eligible(self):
+    def test_abort_during_guesses_scores_eligible(self, make_orchestrator, make_gprm):
         """Test aborting when a player submitted a guess — should score."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
         orchestrator.start_round(make_gprm(1))
 
         # Simulate: advance to guess collection, player1 submitted guess
@@ -171,71 +238,40 @@ class TestAbortCurrentGame:
         outgoing = orchestrator.abort_current_game("new_round_started")
 
         # Should have Q21SCOREFEEDBACK for player1 + MATCH_RESULT_REPORT
-        score_msgs = [
-            (e, s, r) for e, s, r in outgoing
-            if e.get("message_type") == "Q21SCOREFEEDBACK"
-        ]
+        grouped = by_type(outgoing)
+        score_msgs = grouped[SCORE_FEEDBACK]
         assert len(score_msgs) == 1
         assert score_msgs[0][2] == "p1@test.com"
 
-        match_reports = [
-            (e, s, r) for e, s, r in outgoing
-            if e.get("message_type") == "MATCH_RESULT_REPORT"
-        ]
+        match_reports = grouped[MATCH_REPORT]
         assert len(match_reports) == 1
 
-    def test_abort_sets_game_to_none(self):
+    def test_abort_sets_game_to_none(self, make_orchestrator, make_gprm):
         """Test that abort clears the current game."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
         orchestrator.start_round(make_gprm(1))
         orchestrator.abort_current_game("new_round_started")
         assert orchestrator.current_game is None
 
-    def test_abort_transitions_state_machine(self):
+    def test_abort_transitions_state_machine(self, in_game_orchestrator, make_gprm):
         """Test abort transitions state machine with GAME_ABORTED."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
-        # Get to IN_GAME state
-        orchestrator.state_machine.transition(RLGMEvent.SEASON_START)
-        orchestrator.state_machine.transition(RLGMEvent.REGISTRATION_ACCEPTED)
-        orchestrator.state_machine.transition(RLGMEvent.ASSIGNMENT_RECEIVED)
-        orchestrator.state_machine.transition(RLGMEvent.ROUND_START)
-        assert orchestrator.state_machine.current_state == RLGMState.IN_GAME
-
-        # Create a game manually with proper mock attributes
-        mock_game = Mock()
-        mock_game.get_state_snapshot.return_value = {
-            "game_id": "0101001", "phase": "warmup_sent",
-            "player1": {
-                "email": "p1@test.com", "participant_id": "P001",
-                "phase_reached": "warmup_sent", "scored": False,
-                "last_actor": "referee",
-            },
-            "player2": {
-                "email": "p2@test.com", "participant_id": "P002",
-                "phase_reached": "warmup_sent", "scored": False,
-                "last_actor": "referee",
-            },
-        }
-        mock_game.gprm = make_gprm(1)
-        mock_game.state.player1.guess = None
-        mock_game.state.player2.guess = None
-        mock_game.state.player1.score_sent = False
-        mock_game.state.player2.score_sent = False
-        mock_game.state.player1.league_points = 0
-        mock_game.state.player2.league_points = 0
-        mock_game.state.player1.private_score = 0.0
-        mock_game.state.player2.private_score = 0.0
-        mock_game.state.player1.participant_id = "P001"
-        mock_game.state.player1.email = "p1@test.com"
-        mock_game.state.player2.participant_id = "P002"
-        mock_game.state.player2.email = "p2@test.com"
-        mock_game.builder = Mock()
-        mock_game.builder.build_match_result.return_value = (
-            {"message_type": "MATCH_RESULT_REPORT",
-             "payload": {"status": "aborted"}},
-            "subject",
+        orchestrator = in_game_orchestrator
+
+        # Create a game manually from plain stubs
+        stub_game = SimpleNamespace(
+            get_state_snapshot=lambda: _SNAPSHOT,
+            gprm=make_gprm(1),
+            state=SimpleNamespace(
+                player1=PlayerState(email="p1@test.com", participant_id="P001"),
+                player2=PlayerState(email="p2@test.com", participant_id="P002"),
+            ),
+            builder=SimpleNamespace(build_match_result=lambda **k: (
+                {"message_type": MATCH_REPORT,
+                 "payload": {"status": "aborted"}},
+                "subject",
+            )),
         )
-        orchestrator.current_game = mock_game
+        orchestrator.current_game = stub_game
         orchestrator.current_round_number = 1
 
         orchestrator.abort_current_game("new_round_started")
@@ -246,9 +282,9 @@ class TestAbortCurrentGame:
 class TestCompleteGame:
     """Tests for orchestrator.complete_game()."""
 
-    def test_complete_game_clears_current_game(self):
+    def test_complete_game_clears_current_game(self, make_orchestrator, make_gprm):
         """Test that complete_game sets current_game to None."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
         orchestrator.start_round(make_gprm(1))
 
         # Simulate game completion
@@ -263,14 +299,9 @@ class TestCompleteGame:
 
         assert orchestrator.current_game is None
 
-    def test_complete_game_transitions_state(self):
+    def test_complete_game_transitions_state(self, in_game_orchestrator):
         """Test that complete_game fires GAME_COMPLETE event."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
-        # Walk state machine to IN_GAME
-        orchestrator.state_machine.transition(RLGMEvent.SEASON_START)
-        orchestrator.state_machine.transition(RLGMEvent.REGISTRATION_ACCEPTED)
-        orchestrator.state_machine.transition(RLGMEvent.ASSIGNMENT_RECEIVED)
-        orchestrator.state_machine.transition(RLGMEvent.ROUND_START)
+        orchestrator = in_game_orchestrator
 
         orchestrator.current_game = Mock()
         orchestrator.current_game.get_result.return_value = Mock(
@@ -286,9 +317,9 @@ class TestCompleteGame:
 class TestRoundTransitionIntegration:
     """Integration tests for round-to-round transitions."""
 
-    def test_new_round_aborts_current_and_starts_new(self):
+    def test_new_round_aborts_current_and_starts_new(self, make_orchestrator, make_gprm):
         """Test that starting round 2 properly aborts round 1 and starts round 2."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
 
         # Start round 1
         outgoing1 = orchestrator.start_round(make_gprm(1))
@@ -305,15 +336,16 @@ class TestRoundTransitionIntegration:
         assert orchestrator.current_round_number == 2
         assert orchestrator.current_game is not round1_game
         # outgoing2 should contain: abort messages + new warmup calls
-        match_reports = [e for e, s, r in outgoing2 if e.get("message_type") == "MATCH_RESULT_REPORT"]
-        warmup_calls = [e for e, s, r in outgoing2 if e.get("message_type") == "Q21WARMUPCALL"]
+        grouped = by_type(outgoing2)
+        match_reports = grouped[MATCH_REPORT]
+        warmup_calls = grouped[WARMUP_CALL]
         assert len(match_reports) == 1
-        assert match_reports[0]["payload"]["status"] == "aborted"
+        assert match_reports[0][0]["payload"]["status"] == "aborted"
         assert len(warmup_calls) == 2
 
-    def test_end_round_aborts_active_game(self):
+    def test_end_round_aborts_active_game(self, make_orchestrator):
         """Test that BROADCAST_END_LEAGUE_ROUND aborts active game."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
         # Walk state to RUNNING
         orchestrator.state_machine.transition(RLGMEvent.SEASON_START)
         orchestrator.state_machine.transition(RLGMEvent.REGISTRATION_ACCEPTED)
@@ -344,14 +376,14 @@ class TestRoundTransitionIntegration:
         orchestrator.handle_lm_message(end_round_msg)
 
         pending = orchestrator.get_pending_outgoing()
-        match_reports = [e for e, s, r in pending if e.get("message_type") == "MATCH_RESULT_REPORT"]
+        match_reports = by_type(pending)[MATCH_REPORT]
         assert len(match_reports) == 1
-        assert match_reports[0]["payload"]["status"] == "aborted"
+        assert match_reports[0][0]["payload"]["status"] == "aborted"
         assert orchestrator.current_game is None
 
-    def test_same_round_number_is_idempotent_via_handle_lm_message(self):
+    def test_same_round_number_is_idempotent_via_handle_lm_message(self, make_orchestrator):
         """Test that the same round arriving twice doesn't create duplicate game."""
-        orchestrator = RLGMOrchestrator(config=make_config(), ai=MockRefereeAI())
+        orchestrator = make_orchestrator()
         orchestrator.state_machine.transition(RLGMEvent.SEASON_START)
         orchestrator.state_machine.transition(RLGMEvent.REGISTRATION_ACCEPTED)
         orchestrator.state_machine.transition(RLGMEvent.ASSIGNMENT_RECEIVED)
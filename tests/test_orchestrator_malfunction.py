@@ -2,13 +2,25 @@
 # PRD: docs/prd-rlgm.md
 """Tests for orchestrator malfunction handling in handle_lm_message."""
 
-import pytest
+from __future__ import annotations
+
+import sys
+from collections import Counter
 from unittest.mock import patch, MagicMock
+
+import pytest
+
 from q21_referee._rlgm.orchestrator import RLGMOrchestrator
 from q21_referee._rlgm.gprm import GPRM
 from q21_referee._rlgm.enums import RLGMEvent
 from q21_referee.callbacks import RefereeAI
 
+pytestmark = pytest.mark.rlgm_orchestrator
+
+# Message types the outgoing-filter assertions look up.
+WARMUP_CALL = sys.intern("Q21WARMUPCALL")
+MATCH_REPORT = sys.intern("MATCH_RESULT_REPORT")
+
 
 class MockRefereeAI(RefereeAI):
     """Mock AI for testing."""
@@ -61,87 +73,33 @@ def make_new_round_message(round_number=1, lookup_table=None):
     }
 
 
-class TestNormalMode:
-    """NORMAL malfunction status: standard two-player game."""
-
-    def test_normal_starts_game(self):
-        """No malfunction -> start_round creates GMC normally."""
-        orch = setup_orchestrator_for_round()
-        msg = make_new_round_message(1, lookup_table=["p1@test.com", "p2@test.com"])
-        orch.handle_lm_message(msg)
-
-        assert orch.current_game is not None
-        assert orch.current_game.state.single_player_mode is False
-
-    def test_normal_sends_two_warmup_calls(self):
-        """Normal mode sends warmup to both players."""
+class TestMalfunctionModes:
+    """NORMAL, SINGLE_PLAYER and CANCELLED handling of a new round."""
+
+    @pytest.mark.parametrize("lookup,game,sp,missing,warmups,cancel_report", [
+        (("p1@test.com", "p2@test.com"), True, False, None, 2, 0),
+        (("p1@test.com",), True, True, "player2", 1, 0),
+        (("p2@test.com",), True, True, "player1", 1, 0),
+        ((), False, None, None, 0, 1),
+        (None, True, False, None, 2, 0),
+    ], ids=["normal", "player2_missing", "player1_missing", "cancelled",
+            "no_lookup_table"])
+    def test_handle_lm_message_modes(self, lookup, game, sp, missing,
+                                     warmups, cancel_report):
+        """Game creation, single-player flags and outgoing mix per status."""
         orch = setup_orchestrator_for_round()
-        msg = make_new_round_message(1, lookup_table=["p1@test.com", "p2@test.com"])
-        orch.handle_lm_message(msg)
+        lookup_table = None if lookup is None else list(lookup)
+        result = orch.handle_lm_message(make_new_round_message(1, lookup_table))
         pending = orch.get_pending_outgoing()
 
-        warmups = [(e, s, r) for e, s, r in pending
-                   if e.get("message_type") == "Q21WARMUPCALL"]
-        assert len(warmups) == 2
-
-    def test_no_lookup_table_is_normal(self):
-        """When lookup table is absent, treat as NORMAL."""
-        orch = setup_orchestrator_for_round()
-        msg = make_new_round_message(1)  # no lookup table
-        orch.handle_lm_message(msg)
-
-        assert orch.current_game is not None
-        assert orch.current_game.state.single_player_mode is False
-
-
-class TestSinglePlayerMode:
-    """SINGLE_PLAYER malfunction status: one player missing."""
-
-    def test_single_player_starts_game_with_flag(self):
-        """Single-player mode sets single_player_mode on GMC."""
-        orch = setup_orchestrator_for_round()
-        # Only p1 in lookup table -> p2 is missing
-        msg = make_new_round_message(1, lookup_table=["p1@test.com"])
-        orch.handle_lm_message(msg)
-
-        assert orch.current_game is not None
-        assert orch.current_game.state.single_player_mode is True
-        assert orch.current_game.state.missing_player_role == "player2"
-
-    def test_single_player_missing_player1(self):
-        """When player1 is missing, missing_player_role is 'player1'."""
-        orch = setup_orchestrator_for_round()
-        # Only p2 in lookup table -> p1 is missing
-        msg = make_new_round_message(1, lookup_table=["p2@test.com"])
-        orch.handle_lm_message(msg)
-
-        assert orch.current_game.state.single_player_mode is True
-        assert orch.current_game.state.missing_player_role == "player1"
-
-    def test_single_player_still_sends_warmup(self):
-        """Single-player mode still calls start_round (warmup is sent)."""
-        orch = setup_orchestrator_for_round()
-        msg = make_new_round_message(1, lookup_table=["p1@test.com"])
-        orch.handle_lm_message(msg)
-        pending = orch.get_pending_outgoing()
-
-        # warmup calls should still be generated
-        warmups = [(e, s, r) for e, s, r in pending
-                   if e.get("message_type") == "Q21WARMUPCALL"]
-        assert len(warmups) >= 1  # at least the active player
-
-
-class TestCancelledMode:
-    """CANCELLED malfunction status: both players missing."""
-
-    def test_cancelled_does_not_start_game(self):
-        """Cancelled mode does NOT create a GMC."""
-        orch = setup_orchestrator_for_round()
-        # Empty lookup table -> both missing
-        msg = make_new_round_message(1, lookup_table=[])
-        orch.handle_lm_message(msg)
-
-        assert orch.current_game is None
+        assert result is None  # new-round handling always returns None
+        assert (orch.current_game is not None) is game
+        if game:
+            assert orch.current_game.state.single_player_mode is sp
+            assert orch.current_game.state.missing_player_role == missing
+        counts = Counter(e.get("message_type") for e, _, _ in pending)
+        assert counts[WARMUP_CALL] == warmups
+        assert counts[MATCH_REPORT] == cancel_report
 
     def test_cancelled_sends_cancel_report(self):
         """Cancelled mode sends MATCH_RESULT_REPORT with cancel status."""
@@ -150,17 +108,8 @@ class TestCancelledMode:
         orch.handle_lm_message(msg)
         pending = orch.get_pending_outgoing()
 
-        reports = [(e, s, r) for e, s, r in pending
-                   if e.get("message_type") == "MATCH_RESULT_REPORT"]
-        assert len(reports) == 1
-        env, _, recipient = reports[0]
+        assert Counter(e.get("message_type") for e, _, _ in pending) == {
+            MATCH_REPORT: 1}
+        env, _, recipient = pending[0]
         assert env["payload"]["status"] == "CANCELLED_ALL_PLAYERS_MALFUNCTION"
         assert recipient == "lm@test.com"
-
-    def test_cancelled_returns_none(self):
-        """handle_lm_message returns None for new round (always)."""
-        orch = setup_orchestrator_for_round()
-        msg = make_new_round_message(1, lookup_table=[])
-        result = orch.handle_lm_message(msg)
-
-        assert result is None
@@ -4,13 +4,36 @@
 Tests for accurate phase tracking in questions and scoring handlers.
 """
 
-import pytest
-from unittest.mock import Mock, patch
+from __future__ import annotations
 
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from q21_referee._gmc.deadline_tracker import DeadlineTracker
+from q21_referee._gmc.router import HandlerContext
 from q21_referee._gmc.state import GameState, GamePhase, PlayerState
 from q21_referee._gmc.handlers.questions import handle_questions
 from q21_referee._gmc.handlers.scoring import handle_guess
 
+# execute_callback is patched in every phase test, so the AI is never
+# called; builders are plain stubs returning fixed envelopes.
+_AI = SimpleNamespace(get_answers=None, get_score_feedback=None)
+_CONTEXT_BUILDER = SimpleNamespace(
+    build_answers_ctx=lambda *a, **k: {"dynamic": {}, "service": {}},
+    build_score_feedback_ctx=lambda *a, **k: {"dynamic": {}, "service": {}},
+)
+_BUILDER = SimpleNamespace(
+    build_answers_batch=lambda **k: (
+        {"message_type": "Q21ANSWERSBATCH", "message_id": "ANS001"}, "subject",
+    ),
+    build_score_feedback=lambda **k: (
+        {"message_type": "Q21SCOREFEEDBACK", "message_id": "SF001"}, "subject",
+    ),
+    build_match_result=lambda **k: (
+        {"message_type": "MATCH_RESULT_REPORT", "message_id": "MR001"}, "subject",
+    ),
+)
+
 
 class TestBothAnswersSent:
     """Tests for the both_answers_sent helper."""
@@ -47,26 +70,16 @@ class TestPhaseAfterQuestions:
     """Tests for phase progression after question handling."""
 
     def _make_ctx(self, state):
-        """Build a minimal ctx mock for handle_questions."""
-        ctx = Mock()
-        ctx.state = state
-        ctx.body = {
-            "message_id": "MSG001",
-            "payload": {"questions": [{"q": "test"}]},
-        }
-        ctx.sender_email = "p1@test.com"
-        ctx.context_builder = Mock()
-        ctx.context_builder.build_answers_ctx.return_value = {
-            "dynamic": {}, "service": {},
-        }
-        ctx.ai = Mock()
-        ctx.ai.get_answers.return_value = {"answers": [{"question_number": 1, "answer": "A"}]}
-        ctx.builder = Mock()
-        ctx.builder.build_answers_batch.return_value = (
-            {"message_type": "Q21ANSWERSBATCH", "message_id": "ANS001"},
-            "subject",
+        """Build a minimal handler context for handle_questions."""
+        return HandlerContext(
+            ai=_AI, state=state, builder=_BUILDER,
+            context_builder=_CONTEXT_BUILDER, config={},
+            body={
+                "message_id": "MSG001",
+                "payload": {"questions": [{"q": "test"}]},
+            },
+            sender_email="p1@test.com", deadline_tracker=DeadlineTracker(),
         )
-        return ctx
 
     @patch(EXEC_CB, return_value={"answers": [{"question_number": 1, "answer": "A"}]})
     def test_first_player_sets_questions_collecting(self, mock_exec):
@@ -101,54 +114,41 @@ class TestPhaseAfterQuestions:
 
 EXEC_CB_SCORING = "q21_referee._gmc.handlers.scoring.execute_callback"
 
+_WORDS160 = " ".join(["word"] * 160)
+_SCORE_RV = {
+    "league_points": 2, "private_score": 50.0,
+    "breakdown": {
+        "opening_sentence_score": 20.0,
+        "sentence_justification_score": 10.0,
+        "associative_word_score": 15.0,
+        "word_justification_score": 5.0,
+    },
+    "feedback": {"opening_sentence": _WORDS160, "associative_word": _WORDS160},
+}
+
 
 class TestPhaseAfterScoring:
     """Tests for phase progression after scoring."""
 
     def _make_ctx(self, state):
-        ctx = Mock()
-        ctx.state = state
-        ctx.body = {
-            "message_id": "MSG001",
-            "payload": {
-                "opening_sentence": "test",
-                "sentence_justification": "test",
-                "associative_word": "test",
-                "word_justification": "test",
-                "confidence": 0.8,
+        return HandlerContext(
+            ai=_AI, state=state, builder=_BUILDER,
+            context_builder=_CONTEXT_BUILDER,
+            config={"league_manager_email": "lm@test.com"},
+            body={
+                "message_id": "MSG001",
+                "payload": {
+                    "opening_sentence": "test",
+                    "sentence_justification": "test",
+                    "associative_word": "test",
+                    "word_justification": "test",
+                    "confidence": 0.8,
+                },
             },
-        }
-        ctx.sender_email = "p1@test.com"
-        ctx.context_builder = Mock()
-        ctx.context_builder.build_score_feedback_ctx.return_value = {
-            "dynamic": {}, "service": {},
-        }
-        ctx.ai = Mock()
-        ctx.builder = Mock()
-        ctx.builder.build_score_feedback.return_value = (
-            {"message_type": "Q21SCOREFEEDBACK", "message_id": "SF001"},
-            "subject",
-        )
-        ctx.builder.build_match_result.return_value = (
-            {"message_type": "MATCH_RESULT_REPORT", "message_id": "MR001"},
-            "subject",
+            sender_email="p1@test.com", deadline_tracker=DeadlineTracker(),
         )
-        ctx.config = {"league_manager_email": "lm@test.com"}
-        return ctx
-
-    @patch(EXEC_CB_SCORING, return_value={
-        "league_points": 2, "private_score": 50.0,
-        "breakdown": {
-            "opening_sentence_score": 20.0,
-            "sentence_justification_score": 10.0,
-            "associative_word_score": 15.0,
-            "word_justification_score": 5.0,
-        },
-        "feedback": {
-            "opening_sentence": " ".join(["word"] * 160),
-            "associative_word": " ".join(["word"] * 160),
-        },
-    })
+
+    @patch(EXEC_CB_SCORING, return_value=_SCORE_RV)
     def test_first_player_scored_sets_guesses_collecting(self, mock_exec):
         """After first player scored, phase should be GUESSES_COLLECTING."""
         state = GameState(game_id="0101001", match_id="0101001",
@@ -162,19 +162,7 @@ class TestPhaseAfterScoring:
 
         assert state.phase == GamePhase.GUESSES_COLLECTING
 
-    @patch(EXEC_CB_SCORING, return_value={
-        "league_points": 2, "private_score": 50.0,
-        "breakdown": {
-            "opening_sentence_score": 20.0,
-            "sentence_justification_score": 10.0,
-            "associative_word_score": 15.0,
-            "word_justification_score": 5.0,
-        },
-        "feedback": {
-            "opening_sentence": " ".join(["word"] * 160),
-            "associative_word": " ".join(["word"] * 160),
-        },
-    })
+    @patch(EXEC_CB_SCORING, return_value=_SCORE_RV)
     def test_both_players_scored_sets_match_reported(self, mock_exec):
         """After both players scored, phase should be MATCH_REPORTED."""
         state = GameState(game_id="0101001", match_id="0101001",
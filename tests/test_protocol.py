@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for protocol falsy field handling."""
 
+from __future__ import annotations
+
 from q21_referee._shared.protocol import build_envelope
 
 
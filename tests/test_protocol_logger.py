@@ -2,7 +2,8 @@
 # PRD: docs/LOGGER_OUTPUT_REFEREE.md
 """Tests for protocol logger."""
 
-import pytest
+from __future__ import annotations
+
 import io
 import sys
 from unittest.mock import patch
@@ -39,8 +40,7 @@ class TestMessageTypeMappings:
             "Q21_GUESS_SUBMISSION": "MY-GUESS",
             "LEAGUE_COMPLETED": "SEASON-ENDED",
         }
-        for msg_type, display in expected.items():
-            assert RECEIVE_DISPLAY_NAMES.get(msg_type) == display
+        assert expected.items() <= RECEIVE_DISPLAY_NAMES.items()
 
     def test_send_display_names_complete(self):
         """Test that all sent message types have display names."""
@@ -52,18 +52,13 @@ class TestMessageTypeMappings:
             "Q21SCOREFEEDBACK": "ROUND-SCORE-REPORT",
             "MATCH_RESULT_REPORT": "SEASON-RESULTS",
         }
-        for msg_type, display in expected.items():
-            assert SEND_DISPLAY_NAMES.get(msg_type) == display
+        assert expected.items() <= SEND_DISPLAY_NAMES.items()
 
     def test_expected_responses_defined(self):
         """Test that all message types have expected responses."""
-        # All receive types should have expected responses
-        for msg_type in RECEIVE_DISPLAY_NAMES:
-            assert msg_type in EXPECTED_RESPONSES
-
-        # All send types should have expected responses
-        for msg_type in SEND_DISPLAY_NAMES:
-            assert msg_type in EXPECTED_RESPONSES
+        # All receive and send types should have expected responses
+        assert RECEIVE_DISPLAY_NAMES.keys() <= EXPECTED_RESPONSES.keys()
+        assert SEND_DISPLAY_NAMES.keys() <= EXPECTED_RESPONSES.keys()
 
     def test_callback_display_names(self):
         """Test callback name → display name mappings."""
@@ -2,8 +2,11 @@
 # PRD: docs/prd-rlgm.md
 """Tests for questions handler deadline setting after sending Q21ANSWERSBATCH."""
 
+from __future__ import annotations
+
 from unittest.mock import MagicMock, patch
 
+from q21_referee._gmc.handlers import questions as _questions
 from q21_referee._gmc.handlers.questions import handle_questions
 from q21_referee._gmc.state import GamePhase, GameState, PlayerState
 from q21_referee._gmc.deadline_tracker import DeadlineTracker
@@ -46,7 +49,7 @@ def _make_ctx(state, deadline_tracker):
 class TestQuestionsHandlerSetsDeadlines:
     """Verify questions handler sets deadlines after sending Q21ANSWERSBATCH."""
 
-    @patch("q21_referee._gmc.handlers.questions.execute_callback")
+    @patch.object(_questions, "execute_callback")
     def test_deadline_set_for_player(self, mock_exec):
         """After sending answers, a deadline is set for the player's guess."""
         mock_exec.return_value = {"answers": ["A"]}
@@ -68,7 +71,7 @@ class TestQuestionsHandlerSetsDeadlines:
         assert expired[0]["player_email"] == "p1@test.com"
         assert expired[0]["phase"] == "guess"
 
-    @patch("q21_referee._gmc.handlers.questions.execute_callback")
+    @patch.object(_questions, "execute_callback")
     def test_deadline_uses_config_timeout(self, mock_exec):
         """Deadline respects player_response_timeout_seconds from config."""
         mock_exec.return_value = {"answers": ["A"]}
@@ -93,7 +96,7 @@ class TestQuestionsHandlerSetsDeadlines:
             expired_late = tracker.check_expired()
             assert len(expired_late) == 1
 
-    @patch("q21_referee._gmc.handlers.questions.execute_callback")
+    @patch.object(_questions, "execute_callback")
     def test_deadline_uses_default_timeout(self, mock_exec):
         """Without config key, default timeout of 40s applies."""
         mock_exec.return_value = {"answers": ["A"]}
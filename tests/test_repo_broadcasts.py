@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for Broadcasts Repository."""
 
+from __future__ import annotations
+
 import pytest
 import tempfile
 import os
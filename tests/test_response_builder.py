@@ -2,7 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for RLGM Response Builder."""
 
-import pytest
+from __future__ import annotations
+
 from q21_referee._rlgm.response_builder import RLGMResponseBuilder
 from q21_referee._rlgm.game_result import GameResult, PlayerScore
 
@@ -141,3 +142,12 @@ class TestRLGMResponseBuilder:
         assert result["message_type"] == "RESPONSE_KEEP_ALIVE"
         assert result["payload"]["referee_id"] == "REF001"
         assert result["payload"]["status"] == "alive"
+
+    def test_keep_alive_responses_are_independent(self):
+        """Mutating one keep-alive response must not leak into the next."""
+        builder = self.create_builder()
+
+        first = builder.build_keep_alive_response()
+        first["payload"]["status"] = "changed"
+
+        assert builder.build_keep_alive_response()["payload"]["status"] == "alive"
@@ -2,7 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for RLGM state and event enums."""
 
-import pytest
+from __future__ import annotations
+
 from q21_referee._rlgm.enums import RLGMState, RLGMEvent
 
 
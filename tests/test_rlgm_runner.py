@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for RLGM Runner integration."""
 
+from __future__ import annotations
+
 from unittest.mock import Mock, patch
 from q21_referee.rlgm_runner import RLGMRunner
 from q21_referee.callbacks import RefereeAI
@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for deadline checking wired into the RLGM polling loop."""
 
+from __future__ import annotations
+
 from unittest.mock import Mock, patch, MagicMock
 from q21_referee.rlgm_runner import RLGMRunner
 
@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for deadline cancellation on valid player response in handlers."""
 
+from __future__ import annotations
+
 from unittest.mock import Mock, patch, MagicMock
 
 from q21_referee._gmc.deadline_tracker import DeadlineTracker
@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for _runner_config message type filtering."""
 
+from __future__ import annotations
+
 from q21_referee._runner_config import INCOMING_MESSAGE_TYPES
 
 
@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for q21_referee._gmc.snapshot — state snapshot builder."""
 
+from __future__ import annotations
+
 from q21_referee._gmc.snapshot import build_state_snapshot
 from q21_referee._gmc.state import GameState, PlayerState, GamePhase
 
@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for RLGM State Machine."""
 
+from __future__ import annotations
+
 import pytest
 from q21_referee._rlgm.state_machine import RLGMStateMachine
 from q21_referee._rlgm.enums import RLGMState, RLGMEvent
@@ -41,6 +43,15 @@ class TestRLGMStateMachineBase:
         with pytest.raises(ValueError):
             sm.transition(RLGMEvent.ROUND_START)
 
+    def test_from_state_skips_replay(self):
+        """from_state starts in the given state and still validates events."""
+        sm = RLGMStateMachine.from_state(RLGMState.RUNNING)
+        assert sm.current_state == RLGMState.RUNNING
+        assert sm.saved_state is None
+
+        sm.transition(RLGMEvent.ROUND_START)
+        assert sm.current_state == RLGMState.IN_GAME
+
     def test_game_aborted_event_exists(self):
         """Test that GAME_ABORTED event exists in RLGMEvent."""
         from q21_referee._rlgm.enums import RLGMEvent
@@ -4,7 +4,7 @@
 Tests for single-player mode fields and active_players() on GameState.
 """
 
-import pytest
+from __future__ import annotations
 
 from q21_referee._gmc.state import GameState, GamePhase, PlayerState
 
@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for TimeoutHandler extracted to _gmc/timeout.py."""
 
+from __future__ import annotations
+
 import signal
 import pytest
 
@@ -2,8 +2,11 @@
 # PRD: docs/prd-rlgm.md
 """Tests for warmup handler deadline setting after sending Q21ROUNDSTART."""
 
+from __future__ import annotations
+
 from unittest.mock import MagicMock, patch
 
+from q21_referee._gmc.handlers import warmup as _warmup
 from q21_referee._gmc.handlers.warmup import handle_warmup_response
 from q21_referee._gmc.state import GamePhase, GameState, PlayerState
 from q21_referee._gmc.deadline_tracker import DeadlineTracker
@@ -49,7 +52,7 @@ def _make_ctx(state, deadline_tracker):
 class TestWarmupHandlerSetsDeadlines:
     """Verify warmup handler sets deadlines after sending Q21ROUNDSTART."""
 
-    @patch("q21_referee._gmc.handlers.warmup.execute_callback")
+    @patch.object(_warmup, "execute_callback")
     def test_deadlines_set_for_both_players(self, mock_exec):
         """After both warmups received, deadlines set for each player."""
         mock_exec.return_value = {
@@ -76,7 +79,7 @@ class TestWarmupHandlerSetsDeadlines:
         assert expired_emails == {"p1@test.com", "p2@test.com"}
         assert all(e["phase"] == "questions" for e in expired)
 
-    @patch("q21_referee._gmc.handlers.warmup.execute_callback")
+    @patch.object(_warmup, "execute_callback")
     def test_deadlines_use_config_timeout(self, mock_exec):
         """Deadlines respect player_response_timeout_seconds from config."""
         mock_exec.return_value = {
@@ -105,7 +108,7 @@ class TestWarmupHandlerSetsDeadlines:
             expired_late = tracker.check_expired()
             assert len(expired_late) == 2
 
-    @patch("q21_referee._gmc.handlers.warmup.execute_callback")
+    @patch.object(_warmup, "execute_callback")
     def test_deadlines_use_default_timeout(self, mock_exec):
         """Without config key, default timeout of 40s applies."""
         mock_exec.return_value = {
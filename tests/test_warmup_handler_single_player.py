@@ -2,8 +2,11 @@
 # PRD: docs/prd-rlgm.md
 """Tests for warmup handler in single-player mode."""
 
+from __future__ import annotations
+
 from unittest.mock import MagicMock, patch
 
+from q21_referee._gmc.handlers import warmup as _warmup
 from q21_referee._gmc.handlers.warmup import handle_warmup_response
 from q21_referee._gmc.state import GamePhase, GameState, PlayerState
 
@@ -53,7 +56,7 @@ def _make_ctx(state):
 class TestWarmupHandlerSinglePlayer:
     """Warmup handler must send Q21ROUNDSTART only to active players."""
 
-    @patch("q21_referee._gmc.handlers.warmup.execute_callback")
+    @patch.object(_warmup, "execute_callback")
     def test_round_start_sent_only_to_active_player(self, mock_exec):
         """In single-player mode, Q21ROUNDSTART goes only to player1."""
         mock_exec.return_value = {
@@ -71,7 +74,7 @@ class TestWarmupHandlerSinglePlayer:
         _env, _subject, recipient = outgoing[0]
         assert recipient == "p1@test.com"
 
-    @patch("q21_referee._gmc.handlers.warmup.execute_callback")
+    @patch.object(_warmup, "execute_callback")
     def test_missing_player_not_sent_round_start(self, mock_exec):
         """Player2 (absent) must NOT receive Q21ROUNDSTART."""
         mock_exec.return_value = {
@@ -87,7 +90,7 @@ class TestWarmupHandlerSinglePlayer:
         recipients = [r for _, _, r in outgoing]
         assert "p2@test.com" not in recipients
 
-    @patch("q21_referee._gmc.handlers.warmup.execute_callback")
+    @patch.object(_warmup, "execute_callback")
     def test_phase_advances_to_round_started(self, mock_exec):
         """Phase should advance to ROUND_STARTED after sending."""
         mock_exec.return_value = {
@@ -102,7 +105,7 @@ class TestWarmupHandlerSinglePlayer:
 
         assert state.phase == GamePhase.ROUND_STARTED
 
-    @patch("q21_referee._gmc.handlers.warmup.execute_callback")
+    @patch.object(_warmup, "execute_callback")
     def test_two_player_mode_sends_to_both(self, mock_exec):
         """In normal (2-player) mode, both players get Q21ROUNDSTART."""
         mock_exec.return_value = {
@@ -2,8 +2,9 @@
 # PRD: docs/prd-rlgm.md
 """Tests for warmup_initiator: building warmup calls for players."""
 
+from __future__ import annotations
+
 from q21_referee._rlgm.warmup_initiator import initiate_warmup
-from q21_referee._rlgm.gprm import GPRM
 from q21_referee._gmc.gmc import GameManagementCycle
 from q21_referee._gmc.state import GamePhase
 from q21_referee.callbacks import RefereeAI
@@ -40,23 +41,12 @@ def make_config():
     }
 
 
-def make_gprm(round_number=1):
-    return GPRM(
-        player1_email="p1@test.com", player1_id="P001",
-        player2_email="p2@test.com", player2_id="P002",
-        season_id="S01", game_id=f"01{round_number:02d}001",
-        match_id=f"01{round_number:02d}001",
-        round_id=f"ROUND_{round_number}", round_number=round_number,
-    )
-
-
 class TestInitiateWarmup:
     """Tests for initiate_warmup function."""
 
-    def test_warmup_sends_to_both_players(self):
+    def test_warmup_sends_to_both_players(self, gprm):
         """Both players receive warmup calls."""
         config = make_config()
-        gprm = make_gprm()
         ai = MockRefereeAI()
         gmc = GameManagementCycle(gprm, ai, config)
 
@@ -66,10 +56,9 @@ class TestInitiateWarmup:
         recipients = {r for _, _, r in outgoing}
         assert recipients == {"p1@test.com", "p2@test.com"}
 
-    def test_warmup_advances_phase(self):
+    def test_warmup_advances_phase(self, gprm):
         """Warmup should advance GMC to WARMUP_SENT."""
         config = make_config()
-        gprm = make_gprm()
         ai = MockRefereeAI()
         gmc = GameManagementCycle(gprm, ai, config)
 
@@ -77,10 +66,9 @@ class TestInitiateWarmup:
 
         assert gmc.state.phase == GamePhase.WARMUP_SENT
 
-    def test_warmup_skips_none_player(self):
+    def test_warmup_skips_none_player(self, gprm):
         """Warmup should skip None players without crashing."""
         config = make_config()
-        gprm = make_gprm()
         ai = MockRefereeAI()
         gmc = GameManagementCycle(gprm, ai, config)
         gmc.state.player2 = None
@@ -90,10 +78,9 @@ class TestInitiateWarmup:
         assert len(outgoing) == 1
         assert outgoing[0][2] == "p1@test.com"
 
-    def test_warmup_skips_both_none_players(self):
+    def test_warmup_skips_both_none_players(self, gprm):
         """Warmup should return empty list when both players are None."""
         config = make_config()
-        gprm = make_gprm()
         ai = MockRefereeAI()
         gmc = GameManagementCycle(gprm, ai, config)
         gmc.state.player1 = None
@@ -107,14 +94,13 @@ class TestInitiateWarmup:
 class TestWarmupCallbackResilience:
     """Tests for warmup callback failure handling."""
 
-    def test_callback_failure_uses_fallback_question(self):
+    def test_callback_failure_uses_fallback_question(self, gprm):
         """If get_warmup_question fails, fallback question is used."""
         class FailingAI(MockRefereeAI):
             def get_warmup_question(self, ctx):
                 raise ValueError("AI exploded")
 
         config = make_config()
-        gprm = make_gprm()
         ai = FailingAI()
         gmc = GameManagementCycle(gprm, ai, config)
 
@@ -2,23 +2,15 @@
 # PRD: docs/prd-rlgm.md
 """Tests for warmup_initiator deadline setting after sending warmup calls."""
 
+from __future__ import annotations
+
 from unittest.mock import patch, MagicMock
 
 from q21_referee._rlgm.warmup_initiator import initiate_warmup
-from q21_referee._rlgm.gprm import GPRM
 from q21_referee._gmc.gmc import GameManagementCycle
 from q21_referee.callbacks import RefereeAI
 
 
-def _make_gprm():
-    return GPRM(
-        player1_email="p1@test.com", player1_id="P001",
-        player2_email="p2@test.com", player2_id="P002",
-        season_id="S01", game_id="0101001", match_id="0101001",
-        round_id="ROUND_1", round_number=1,
-    )
-
-
 def _make_config(**overrides):
     cfg = {
         "referee_email": "ref@test.com",
@@ -38,9 +30,9 @@ def _make_ai():
 class TestWarmupSetsDeadlines:
     """Verify warmup_initiator sets deadlines for active players."""
 
-    def test_warmup_sets_deadline_for_each_active_player(self):
+    def test_warmup_sets_deadline_for_each_active_player(self, gprm_factory):
         """After initiate_warmup, both players should have deadlines set."""
-        gprm = _make_gprm()
+        gprm = gprm_factory(match_id="0101001", round_id="ROUND_1")
         config = _make_config()
         ai = _make_ai()
         gmc = GameManagementCycle(gprm, ai, config)
@@ -60,9 +52,9 @@ class TestWarmupSetsDeadlines:
         assert expired_emails == {"p1@test.com", "p2@test.com"}
         assert all(e["phase"] == "warmup" for e in expired)
 
-    def test_warmup_uses_config_timeout(self):
+    def test_warmup_uses_config_timeout(self, gprm_factory):
         """When config sets player_response_timeout_seconds=120, use it."""
-        gprm = _make_gprm()
+        gprm = gprm_factory(match_id="0101001", round_id="ROUND_1")
         config = _make_config(player_response_timeout_seconds=120)
         ai = _make_ai()
         gmc = GameManagementCycle(gprm, ai, config)
@@ -83,9 +75,9 @@ class TestWarmupSetsDeadlines:
             expired_late = gmc.deadline_tracker.check_expired()
             assert len(expired_late) == 2
 
-    def test_warmup_uses_default_timeout_when_not_configured(self):
+    def test_warmup_uses_default_timeout_when_not_configured(self, gprm_factory):
         """Without config key, default timeout of 40s applies."""
-        gprm = _make_gprm()
+        gprm = gprm_factory(match_id="0101001", round_id="ROUND_1")
         config = _make_config()  # No player_response_timeout_seconds
         ai = _make_ai()
         gmc = GameManagementCycle(gprm, ai, config)
@@ -2,8 +2,9 @@
 # PRD: docs/prd-rlgm.md
 """Tests for warmup_initiator single-player mode support."""
 
+from __future__ import annotations
+
 from q21_referee._rlgm.warmup_initiator import initiate_warmup
-from q21_referee._rlgm.gprm import GPRM
 from q21_referee._gmc.gmc import GameManagementCycle
 from q21_referee._gmc.state import GamePhase
 from q21_referee.callbacks import RefereeAI
@@ -40,23 +41,13 @@ def make_config():
     }
 
 
-def make_gprm():
-    return GPRM(
-        player1_email="p1@test.com", player1_id="P001",
-        player2_email="p2@test.com", player2_id="P002",
-        season_id="S01", game_id="0101001",
-        match_id="0101001",
-        round_id="S01_R1", round_number=1,
-    )
-
-
 class TestWarmupSinglePlayerMode:
     """Tests for warmup_initiator with single-player mode."""
 
-    def test_normal_mode_sends_to_both_players(self):
+    def test_normal_mode_sends_to_both_players(self, gprm_factory):
         """Normal mode: warmup sent to both players."""
         config = make_config()
-        gprm = make_gprm()
+        gprm = gprm_factory(match_id="0101001", round_id="S01_R1")
         ai = MockRefereeAI()
         gmc = GameManagementCycle(gprm=gprm, ai=ai, config=config)
 
@@ -66,10 +57,10 @@ class TestWarmupSinglePlayerMode:
         recipients = {r for _, _, r in outgoing}
         assert recipients == {"p1@test.com", "p2@test.com"}
 
-    def test_single_player_sends_only_to_active_player(self):
+    def test_single_player_sends_only_to_active_player(self, gprm_factory):
         """Single-player mode (missing player2): only 1 warmup sent."""
         config = make_config()
-        gprm = make_gprm()
+        gprm = gprm_factory(match_id="0101001", round_id="S01_R1")
         ai = MockRefereeAI()
         gmc = GameManagementCycle(
             gprm=gprm, ai=ai, config=config,
@@ -82,10 +73,10 @@ class TestWarmupSinglePlayerMode:
         assert len(outgoing) == 1
         assert outgoing[0][2] == "p1@test.com"
 
-    def test_single_player_missing_player1(self):
+    def test_single_player_missing_player1(self, gprm_factory):
         """Single-player mode (missing player1): only player2 gets warmup."""
         config = make_config()
-        gprm = make_gprm()
+        gprm = gprm_factory(match_id="0101001", round_id="S01_R1")
         ai = MockRefereeAI()
         gmc = GameManagementCycle(
             gprm=gprm, ai=ai, config=config,
@@ -98,10 +89,10 @@ class TestWarmupSinglePlayerMode:
         assert len(outgoing) == 1
         assert outgoing[0][2] == "p2@test.com"
 
-    def test_single_player_advances_phase(self):
+    def test_single_player_advances_phase(self, gprm_factory):
         """Phase advances to WARMUP_SENT even in single-player mode."""
         config = make_config()
-        gprm = make_gprm()
+        gprm = gprm_factory(match_id="0101001", round_id="S01_R1")
         ai = MockRefereeAI()
         gmc = GameManagementCycle(
             gprm=gprm, ai=ai, config=config,